@@ -0,0 +1 @@
+"""Benchmarks of AoC solutions on synthetic inputs."""
@@ -0,0 +1,65 @@
+"""Runs benchmarks and compares them with saved baseline.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks [-d DAY] [-s SIZE] [--save]
+
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from .generators import default_sizes, generate, generators
+from .harness import compare, format_results, measure, measure_import, Measurement
+
+default_baseline = Path(__file__).parent / "baseline.json"
+
+
+def main() -> int:
+    parser = ArgumentParser(prog="benchmarks", description="Benchmarks AoC solutions on synthetic inputs.")
+    parser.add_argument("-d", "--day", type=int, action="append", choices=sorted(generators), help="day to benchmark")
+    parser.add_argument("-s", "--size", type=int, action="append", help="input size, defaults to per day sizes")
+    parser.add_argument("--seed", type=int, default=0, help="input generator seed")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("-b", "--baseline", type=Path, default=default_baseline, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="save results as new baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.2, help="allowed relative time increase")
+    parser.add_argument("--memory-threshold", type=float, default=0.2, help="allowed relative memory increase")
+    parser.add_argument("--min-time", type=float, default=0.001, help="time increase [s] always tolerated")
+    args = parser.parse_args()
+
+    results: dict[str, Measurement] = {}
+    with TemporaryDirectory() as directory:
+        for day in args.day or sorted(generators):
+            results[f"day_{day}/import"] = measure_import(day, args.repeat)
+
+            for size in args.size or default_sizes[day]:
+                input_file = Path(directory) / f"day_{day}_{size}.txt"
+                input_file.write_text(generate(day, size, args.seed))
+
+                print(f"Benchmarking day {day}, size {size}", file=sys.stderr, flush=True)
+                for phase, measurement in measure(day, input_file, args.repeat).items():
+                    results[f"day_{day}/size_{size}/{phase}"] = measurement
+
+    print(format_results(results.items()))
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = {key: Measurement(**value) for key, value in json.loads(args.baseline.read_text()).items()}
+
+    if args.save:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps({key: value._asdict() for key, value in baseline.items()}, indent=2))
+
+        return 0
+
+    regressions = compare(results, baseline, args.time_threshold, args.memory_threshold, args.min_time)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+sys.exit(main())
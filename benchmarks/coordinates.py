@@ -0,0 +1,52 @@
+"""Micro benchmark of `Coordinate` operations used in hot loops of grid days.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.coordinates
+
+"""
+
+from timeit import repeat as timeit_repeat
+
+from aoc.tools.coordinates import Coordinate, Direction
+
+operations = {
+    "create": "Coordinate(3, 4)",
+    "add": "a + b",
+    "sub": "a - b",
+    "mul": "a * 3",
+    "hash": "hash(a)",
+    "eq": "a == b",
+    "in set": "a in grid",
+    "attributes": "a.row + a.position",
+    "move": "a + Direction.RIGHT.value",
+}
+
+
+def measure_operations(number: int = 200_000, repeat: int = 5) -> dict[str, float]:
+    """Measures cost of single `Coordinate` operations.
+
+    Args:
+        number (int, optional): Number of operations in timed run. Defaults to 200 000.
+        repeat (int, optional): Number of timed runs, best one is kept. Defaults to 5.
+
+    Returns:
+        dict[str, float]: Operation costs [ns].
+
+    """
+    namespace = {
+        "Coordinate": Coordinate,
+        "Direction": Direction,
+        "a": Coordinate(3, 4),
+        "b": Coordinate(1, 0),
+        "grid": {Coordinate(row, position) for row in range(100) for position in range(100)},
+    }
+
+    return {
+        name: min(timeit_repeat(statement, globals=namespace, number=number, repeat=repeat)) / number * 1e9
+        for name, statement in operations.items()
+    }
+
+
+if __name__ == "__main__":
+    for operation, cost in measure_operations().items():
+        print(f"{operation:<12}{cost:>8.0f} ns")
@@ -0,0 +1,428 @@
+"""Deterministic synthetic input generators for every day.
+
+Each generator takes seeded random generator and size of input in its natural unit (lines, grid side,
+ranges per map, ...) and returns input text in the format of original challenge.
+
+"""
+
+from itertools import islice, product
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable, Iterator
+
+Generator = Callable[[Random, int], str]
+
+generators: dict[int, Generator] = {}
+"""Input generators by day."""
+
+default_sizes: dict[int, tuple[int, ...]] = {}
+"""Default benchmarked sizes by day."""
+
+
+def generator(day: int, *sizes: int) -> Callable[[Generator], Generator]:
+    """Registers input generator for given day."""
+
+    def register(function: Generator) -> Generator:
+        generators[day] = function
+        default_sizes[day] = sizes
+
+        return function
+
+    return register
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """Generates input for given day.
+
+    Args:
+        day (int): Day number.
+        size (int): Size of input in day specific unit.
+        seed (int, optional): Random generator seed. Defaults to 0.
+
+    Returns:
+        str: Input text.
+
+    """
+    return generators[day](Random(f"{day}:{size}:{seed}"), size)
+
+
+digit_words = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+
+@generator(1, 1_000, 10_000)
+def day_1(rng: Random, size: int) -> str:
+    """Size is number of lines."""
+
+    lines = []
+    for _ in range(size):
+        tokens = [rng.choice(ascii_lowercase) for _ in range(rng.randint(5, 30))]
+        tokens += [rng.choice(digit_words) for _ in range(rng.randint(0, 3))]
+        tokens += [str(rng.randint(1, 9)) for _ in range(rng.randint(1, 3))]
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2, 1_000, 10_000)
+def day_2(rng: Random, size: int) -> str:
+    """Size is number of games."""
+
+    lines = []
+    for game in range(1, size + 1):
+        subsets = [
+            ", ".join(
+                f"{rng.randint(1, 20)} {color}" for color in rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            )
+            for _ in range(rng.randint(1, 6))
+        ]
+        lines.append(f"Game {game}: {'; '.join(subsets)}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(3, 50, 200)
+def day_3(rng: Random, size: int) -> str:
+    """Size is grid side."""
+
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.15:
+                row += str(rng.randint(1, 999)) + "."
+            elif roll < 0.22:
+                row += rng.choice("*#+$/@=%&-")
+            else:
+                row += "."
+        rows.append(row[:size])
+
+    return "\n".join(rows) + "\n"
+
+
+@generator(4, 200, 2_000)
+def day_4(rng: Random, size: int) -> str:
+    """Size is number of cards."""
+
+    lines = []
+    for card in range(1, size + 1):
+        matches = min(rng.choice((0, 0, 0, 1, 1, 2, 3, 4, 5, 6, 8, 10)), size - card)
+        winning = rng.sample(range(1, 100), 10)
+        others = [number for number in range(1, 100) if number not in winning]
+        guessed = winning[:matches] + rng.sample(others, 25 - matches)
+        rng.shuffle(guessed)
+        lines.append(
+            f"Card {card:>4}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in guessed)}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(5, 10, 100)
+def day_5(rng: Random, size: int) -> str:
+    """Size is number of ranges in every map and of seed ranges."""
+
+    space = 2**32
+    seeds = []
+    for _ in range(size):
+        start = rng.randrange(space)
+        seeds += [start, rng.randint(1, (space - start) // 4 + 1)]
+
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    names = ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location")
+    for source, target in zip(names, names[1:]):
+        bounds = sorted(rng.sample(range(1, space), size))
+        lines = [f"{source}-to-{target} map:"]
+        for start, stop in zip([0] + bounds, bounds):
+            if rng.random() < 0.9:
+                lines.append(f"{rng.randrange(space - (stop - start))} {start} {stop - start}")
+        sections.append("\n".join(lines))
+
+    return "\n\n".join(sections) + "\n"
+
+
+@generator(6, 1, 3)
+def day_6(rng: Random, size: int) -> str:
+    """Size is number of races, joined race for second part grows by two digits with every race."""
+
+    times = [rng.randint(10, 99) for _ in range(size)]
+    distances = [rng.randint(time * time // 8, time * time // 4 - 1) for time in times]
+
+    return f"Time: {' '.join(f'{time:>4}' for time in times)}\nDistance: {' '.join(f'{d:>4}' for d in distances)}\n"
+
+
+@generator(7, 1_000, 10_000)
+def day_7(rng: Random, size: int) -> str:
+    """Size is number of hands."""
+
+    return "".join(f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}\n" for _ in range(size))
+
+
+@generator(8, 100, 1_000)
+def day_8(rng: Random, size: int) -> str:
+    """Size is length of every ghost path.
+
+    Every ghost walks a cycle through `size` nodes ending at `Z` node, which leads back to cycle start.
+
+    """
+    size = min(size, 2_500)
+    names = _names(rng, 3, ascii_uppercase, lambda name: name[-1] not in "AZ")
+    prefixes = ["AA"] + rng.sample(list(_names(rng, 2, ascii_uppercase, lambda prefix: prefix not in ("AA", "ZZ"))), 5)
+    nodes = []
+
+    for prefix in prefixes:
+        start, finish = (prefix + "A", prefix + "Z") if prefix != "AA" else ("AAA", "ZZZ")
+
+        path = [start] + [next(names) for _ in range(rng.randint(size // 2, size) - 1)] + [finish]
+        for node, next_node in zip(path, path[1:]):
+            nodes.append(f"{node} = ({next_node}, {next_node})")
+        nodes.append(f"{finish} = ({path[1]}, {path[1]})")
+
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(2, 300)))
+
+    return f"{instructions}\n\n" + "\n".join(nodes) + "\n"
+
+
+@generator(9, 1_000, 10_000)
+def day_9(rng: Random, size: int) -> str:
+    """Size is number of histories."""
+
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [sum(c * x**power for power, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(10, 20, 100)
+def day_10(rng: Random, size: int) -> str:
+    """Size is grid side. Loop runs along grid border with start on top edge."""
+
+    size = max(size, 5)
+    grid = [[rng.choice("|-LJ7F..") for _ in range(size)] for _ in range(size)]
+    top, bottom, left, right = 1, size - 2, 1, size - 2
+
+    for column in range(left + 1, right):
+        grid[top][column] = grid[bottom][column] = "-"
+    for row in range(top + 1, bottom):
+        grid[row][left] = grid[row][right] = "|"
+    grid[top][left], grid[top][right], grid[bottom][left], grid[bottom][right] = "F", "7", "L", "J"
+
+    start = rng.randint(left + 1, right - 1)
+    grid[top][start] = "S"
+    grid[top - 1][start] = grid[top + 1][start] = "."
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(11, 20, 100)
+def day_11(rng: Random, size: int) -> str:
+    """Size is grid side."""
+
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_columns = set(rng.sample(range(size), size // 10))
+    density = 3 / size
+
+    rows = [
+        "".join(
+            "#" if row not in empty_rows and column not in empty_columns and rng.random() < density else "."
+            for column in range(size)
+        )
+        for row in range(size)
+    ]
+
+    return "\n".join(rows) + "\n"
+
+
+@generator(12, 100, 1_000)
+def day_12(rng: Random, size: int) -> str:
+    """Size is number of condition records."""
+
+    lines = []
+    for _ in range(size):
+        groups = [rng.randint(1, 4) for _ in range(rng.randint(1, 5))]
+        springs = "." * rng.randint(0, 2) + ".".join("#" * group + "." * rng.randint(0, 2) for group in groups)
+        springs = "".join("?" if rng.random() < 0.5 else spring for spring in springs)
+        lines.append(f"{springs} {','.join(map(str, groups))}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(13, 100, 1_000)
+def day_13(rng: Random, size: int) -> str:
+    """Size is number of patterns.
+
+    Every pattern has one exact reflection and one more reflection with single smudge.
+
+    """
+    patterns = []
+    for _ in range(size):
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        horizontal = rng.choice([a for a in range(height - 1) if a + 1 != height - a - 1])
+        vertical = rng.randrange(width - 1)
+        span = min(vertical + 1, width - vertical - 1)
+
+        rows = []
+        for _ in range(height):
+            row = [rng.choice("#.") for _ in range(width)]
+            for offset in range(span):
+                row[vertical + 1 + offset] = row[vertical - offset]
+            rows.append(row)
+
+        reflected = min(horizontal + 1, height - horizontal - 1)
+        for offset in range(reflected):
+            rows[horizontal + 1 + offset] = list(rows[horizontal - offset])
+
+        outside = [
+            row for row in range(height) if not horizontal - reflected < row <= horizontal + reflected
+        ]
+        smudge_row = rows[rng.choice(outside)]
+        smudge_column = rng.randint(vertical - span + 1, vertical + span)
+        smudge_row[smudge_column] = "#" if smudge_row[smudge_column] == "." else "."
+
+        if rng.random() < 0.5:
+            rows = [list(column) for column in zip(*rows)]
+
+        patterns.append("\n".join("".join(row) for row in rows))
+
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(14, 10, 50)
+def day_14(rng: Random, size: int) -> str:
+    """Size is grid side."""
+
+    rows = ["".join(rng.choices("O#.", weights=(20, 15, 65), k=size)) for _ in range(size)]
+
+    return "\n".join(rows) + "\n"
+
+
+@generator(15, 1_000, 10_000)
+def day_15(rng: Random, size: int) -> str:
+    """Size is number of steps."""
+
+    labels = ["".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(size // 5, 1))]
+    steps = [
+        f"{rng.choice(labels)}-" if rng.random() < 0.3 else f"{rng.choice(labels)}={rng.randint(1, 9)}"
+        for _ in range(size)
+    ]
+
+    return ",".join(steps) + "\n"
+
+
+@generator(16, 10, 50)
+def day_16(rng: Random, size: int) -> str:
+    """Size is grid side."""
+
+    rows = ["".join(rng.choices("|-/\\.", weights=(3, 3, 3, 3, 88), k=size)) for _ in range(size)]
+
+    return "\n".join(rows) + "\n"
+
+
+@generator(17, 10, 40)
+def day_17(rng: Random, size: int) -> str:
+    """Size is grid side."""
+
+    rows = ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
+
+    return "\n".join(rows) + "\n"
+
+
+@generator(18, 100, 1_000)
+def day_18(rng: Random, size: int) -> str:
+    """Size is approximate number of dig steps.
+
+    Both parts dig staircase shaped loops with the same number of steps.
+
+    """
+    stairs = max(size // 2, 1)
+    first = _staircase(rng, stairs, 10)
+    second = _staircase(rng, stairs, 100_000)
+    directions = {"R": 0, "D": 1, "L": 2, "U": 3}
+
+    return "".join(
+        f"{direction} {length} (#{second_length:05x}{directions[second_direction]})\n"
+        for (direction, length), (second_direction, second_length) in zip(first, second)
+    )
+
+
+@generator(19, 100, 1_000)
+def day_19(rng: Random, size: int) -> str:
+    """Size is number of workflows and of parts."""
+
+    names = ["in"] + list(islice(_names(rng, 3, ascii_lowercase, lambda name: name != "in"), size - 1))
+
+    def target(index: int) -> str:
+        later = names[index + 1 :]
+        return rng.choice(later + ["A", "R"] if later else ["A", "R"])
+
+    workflows = []
+    for index, name in enumerate(names):
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target(index)}"
+            for _ in range(rng.randint(1, 4))
+        ]
+        workflows.append(f"{name}{{{','.join(rules)},{target(index)}}}")
+
+    rng.shuffle(workflows)
+    parts = ["{" + ",".join(f"{rating}={rng.randint(1, 4000)}" for rating in "xmas") + "}" for _ in range(size)]
+
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+@generator(20, 2, 4)
+def day_20(rng: Random, size: int) -> str:
+    """Size is number of binary counters feeding `rx` module.
+
+    Every counter is a chain of 12 flip-flops with conjunction resetting it after random period.
+
+    """
+    names = _names(rng, 2, ascii_lowercase, lambda name: name != "rx")
+    final = next(names)
+    lines = []
+    heads = []
+
+    for _ in range(size):
+        period = rng.randrange(2049, 4096) | 1
+        flip_flops = [next(names) for _ in range(12)]
+        hub, inverter = next(names), next(names)
+        heads.append(flip_flops[0])
+
+        hub_targets = [inverter]
+        for bit, flip_flop in enumerate(flip_flops):
+            targets = flip_flops[bit + 1 : bit + 2]
+            if period >> bit & 1:
+                targets.append(hub)
+            if not period >> bit & 1 or bit == 0:
+                hub_targets.append(flip_flop)
+            lines.append(f"%{flip_flop} -> {', '.join(targets)}")
+
+        lines.append(f"&{hub} -> {', '.join(hub_targets)}")
+        lines.append(f"&{inverter} -> {final}")
+
+    lines.append(f"&{final} -> rx")
+    rng.shuffle(lines)
+
+    return f"broadcaster -> {', '.join(heads)}\n" + "\n".join(lines) + "\n"
+
+
+def _names(rng: Random, length: int, alphabet: str, condition: Callable[[str], bool]) -> Iterator[str]:
+    names = ["".join(letters) for letters in product(alphabet, repeat=length)]
+    rng.shuffle(names)
+
+    return (name for name in names if condition(name))
+
+
+def _staircase(rng: Random, stairs: int, max_length: int) -> list[tuple[str, int]]:
+    steps = []
+    for _ in range(stairs):
+        steps += [("R", rng.randint(1, max_length)), ("D", rng.randint(1, max_length))]
+
+    width = sum(length for direction, length in steps if direction == "R")
+    height = sum(length for direction, length in steps if direction == "D")
+
+    return steps + [("L", width), ("U", height)]
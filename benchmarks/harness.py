@@ -0,0 +1,154 @@
+"""Benchmark harness measuring time and memory of every solving phase."""
+
+import json
+import subprocess
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Iterable, NamedTuple
+
+from aoc import days
+
+phases = ("parse", "part_1", "part_2")
+
+
+class Measurement(NamedTuple):
+    """Measured phase cost."""
+
+    time: float
+    """Best wall time [s]."""
+    memory: int
+    """Peak of Python allocations [B]."""
+
+
+def measure(day: int, input_file: str | Path, repeat: int = 3) -> dict[str, Measurement]:
+    """Measures all phases of solving given input.
+
+    Every run is done in a fresh process, so caches of previous runs don't affect results.
+
+    Args:
+        day (int): Day number.
+        input_file (str | Path): Input file path.
+        repeat (int, optional): Number of timed runs, best time is kept. Defaults to 3.
+
+    Returns:
+        dict[str, Measurement]: Measurements by phase.
+
+    """
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        timings = [executor.submit(_run, day, str(input_file), False).result() for _ in range(repeat)]
+        memory = executor.submit(_run, day, str(input_file), True).result()
+
+    return {phase: Measurement(min(timing[phase] for timing in timings), int(memory[phase])) for phase in phases}
+
+
+def measure_import(day: int, repeat: int = 3) -> Measurement:
+    """Measures import of `aoc` package and solution class of given day.
+
+    Every import is done in a fresh interpreter, so modules imported by interpreter itself
+    (e.g. by `site`) are not measured.
+
+    Args:
+        day (int): Day number.
+        repeat (int, optional): Number of timed imports, best time is kept. Defaults to 3.
+
+    Returns:
+        Measurement: Import cost.
+
+    """
+    timings = [_run_import(day, False)[0] for _ in range(repeat)]
+    _, memory = _run_import(day, True)
+
+    return Measurement(min(timings), int(memory))
+
+
+def compare(
+    results: dict[str, Measurement],
+    baseline: dict[str, Measurement],
+    time_threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+    min_time: float = 0.001,
+) -> list[str]:
+    """Compares results with baseline.
+
+    Args:
+        results (dict[str, Measurement]): Current measurements.
+        baseline (dict[str, Measurement]): Baseline measurements.
+        time_threshold (float, optional): Allowed relative time increase. Defaults to 0.2.
+        memory_threshold (float, optional): Allowed relative memory increase. Defaults to 0.2.
+        min_time (float, optional): Time increase [s] which is never reported, as it is below
+            measurement noise. Defaults to 0.001.
+
+    Returns:
+        list[str]: Descriptions of regressions.
+
+    """
+    regressions = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        base = baseline[key]
+        if result.time > base.time * (1 + time_threshold) and result.time - base.time > min_time:
+            regressions.append(f"{key}: time {base.time:.4f} s -> {result.time:.4f} s")
+        if result.memory > base.memory * (1 + memory_threshold):
+            regressions.append(f"{key}: memory {base.memory} B -> {result.memory} B")
+
+    return regressions
+
+
+def _run(day: int, input_file: str, trace_memory: bool) -> dict[str, float]:
+    solution = days[day](input_file)
+    steps: dict[str, Callable[[], object]] = {
+        "parse": lambda: solution.parsed_input,
+        "part_1": solution.part_1,
+        "part_2": solution.part_2,
+    }
+    results = {}
+
+    if trace_memory:
+        tracemalloc.start()
+
+    for phase in phases:
+        if trace_memory:
+            tracemalloc.reset_peak()
+            steps[phase]()
+            results[phase] = tracemalloc.get_traced_memory()[1]
+        else:
+            start = perf_counter()
+            steps[phase]()
+            results[phase] = perf_counter() - start
+
+    if trace_memory:
+        tracemalloc.stop()
+
+    return results
+
+
+def _run_import(day: int, trace_memory: bool) -> tuple[float, float]:
+    script = (
+        "import json, time, tracemalloc\n"
+        f"if {trace_memory}: tracemalloc.start()\n"
+        "start = time.perf_counter()\n"
+        "import aoc\n"
+        f"aoc.days[{day}]\n"
+        "print(json.dumps([time.perf_counter() - start, tracemalloc.get_traced_memory()[1]]))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True).stdout
+
+    duration, memory = json.loads(output)
+
+    return duration, memory
+
+
+def format_results(results: Iterable[tuple[str, Measurement]]) -> str:
+    """Formats measurements as text table."""
+
+    rows = [("Benchmark", "Time [s]", "Memory [KiB]")]
+    rows += [(key, f"{result.time:.4f}", f"{result.memory / 1024:.1f}") for key, result in results]
+    widths = [max(len(row[column]) for row in rows) for column in range(3)]
+
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
@@ -0,0 +1,10 @@
+"""Solutions for AoC 2023.
+
+Solution classes are available by day number in `days` registry, e.g. `days[5]`, which imports
+only the module of requested day.
+
+"""
+
+from ._registry import DayRegistry
+
+days = DayRegistry(__name__, __path__)
@@ -0,0 +1,101 @@
+"""Process pool shared by asynchronous solves."""
+
+import asyncio
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
+
+_workers: Optional[int] = None
+_executor: Optional[ProcessPoolExecutor] = None
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+
+def configure(workers: Optional[int] = None) -> None:
+    """Sets number of worker processes used by `Aoc.solve_async`.
+
+    Running pool is shut down, new one is started by next solve.
+
+    Args:
+        workers (Optional[int], optional): Number of worker processes, which is also limit of
+            concurrently running solves. Defaults to number of CPU cores.
+
+    """
+    global _workers
+
+    shutdown()
+    _workers = workers
+
+
+def shutdown() -> None:
+    """Shuts down shared process pool, cancelling solves which didn't start yet."""
+
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+    _semaphores.clear()
+
+
+async def submit(function: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+    """Runs function on shared process pool without blocking event loop.
+
+    At most `workers` functions run at once, others wait for free worker before their arguments
+    are sent to pool. Function which already started in worker can't be interrupted, when it is
+    cancelled or times out, its worker stays occupied until function returns.
+
+    Args:
+        function (Callable[..., Any]): Picklable function.
+        *args (Any): Picklable function arguments.
+        timeout (Optional[float], optional): Time limit including waiting for free worker [s].
+            Defaults to no limit.
+
+    Raises:
+        TimeoutError: Function didn't finish in time.
+
+    Returns:
+        Any: Function result.
+
+    """
+    async with asyncio.timeout(timeout):
+        semaphore = _get_semaphore()
+        await semaphore.acquire()
+
+        try:
+            future: Future = _get_executor().submit(function, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        # Worker is released when function really ends, not when waiting for it is cancelled.
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda _: _release(loop, semaphore))
+
+        return await asyncio.wrap_future(future)
+
+
+def _release(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:  # Event loop was closed before function ended.
+        pass
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=_workers)
+
+    return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    # Semaphores can't be shared between event loops.
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(_workers or os.cpu_count() or 1)
+
+    return _semaphores[loop]
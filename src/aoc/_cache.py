@@ -0,0 +1,159 @@
+"""Persistent cache of challenge answers."""
+
+import sys
+from functools import cache
+from pathlib import Path
+from time import time
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
+
+default_cache_path = Path.home() / ".cache" / "aoc" / "answers.sqlite3"
+
+
+class CachedAnswer(NamedTuple):
+    """Answer stored in cache."""
+
+    answer: int
+    solve_time: float
+    """Time of original solve [s]."""
+    created_at: float
+
+
+class AnswerCache:
+    """SQLite backed answer store.
+
+    Entries are keyed by hash of input bytes and source of solving module, so changing either one
+    results in a cache miss. Cache can be shared between processes.
+
+    Args:
+        path (str | Path, optional): Database file path. Defaults to `~/.cache/aoc/answers.sqlite3`.
+        max_entries (Optional[int], optional): Number of entries kept, least recently used ones
+            are evicted first. Defaults to no limit.
+        max_age (Optional[float], optional): Maximal entry age [s]. Defaults to no limit.
+
+    """
+
+    def __init__(
+        self, path: str | Path = default_cache_path, max_entries: Optional[int] = None, max_age: Optional[float] = None
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._connection: Optional["sqlite3.Connection"] = None
+
+    def __getstate__(self) -> dict:
+        return {**self.__dict__, "_connection": None}  # Connections can't be shared between processes.
+
+    @property
+    def connection(self) -> "sqlite3.Connection":
+        """Database connection, opened on first use."""
+
+        if self._connection is None:
+            import sqlite3  # Imported on first use to keep startup of runs without cache fast.
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS answers ("
+                    "key TEXT PRIMARY KEY, answer TEXT, solve_time REAL, created_at REAL, accessed_at REAL)"
+                )
+
+        return self._connection
+
+    def get(self, key: str) -> Optional[CachedAnswer]:
+        """Returns cached answer or `None` on miss."""
+
+        with self.connection as connection:
+            row = connection.execute(
+                "SELECT answer, solve_time, created_at FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            answer, solve_time, created_at = row
+            if self.max_age is not None and created_at < time() - self.max_age:
+                connection.execute("DELETE FROM answers WHERE key = ?", (key,))
+                return None
+
+            connection.execute("UPDATE answers SET accessed_at = ? WHERE key = ?", (time(), key))
+
+        return CachedAnswer(int(answer), solve_time, created_at)
+
+    def put(self, key: str, answer: int, solve_time: float) -> None:
+        """Stores answer and evicts entries exceeding cache limits."""
+
+        now = time()
+        with self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)", (key, str(answer), solve_time, now, now)
+            )
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes entries exceeding age and size limits."""
+
+        with self.connection as connection:
+            if self.max_age is not None:
+                connection.execute("DELETE FROM answers WHERE created_at < ?", (time() - self.max_age,))
+
+            if self.max_entries is not None:
+                connection.execute(
+                    "DELETE FROM answers WHERE key NOT IN "
+                    "(SELECT key FROM answers ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        """Removes all entries."""
+
+        with self.connection as connection:
+            connection.execute("DELETE FROM answers")
+
+
+def file_digest(path: str | Path) -> str:
+    """Calculates SHA-256 hash of file content."""
+
+    import hashlib
+
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def data_digest(data: bytes) -> str:
+    """Calculates SHA-256 hash of data."""
+
+    import hashlib
+
+    return hashlib.sha256(data).hexdigest()
+
+
+@cache
+def source_digest(module_name: str) -> str:
+    """Calculates SHA-256 hash of module source.
+
+    Sources of all modules in a package are hashed for packages. Sources shared by all days,
+    `Aoc` base class and `aoc.tools`, are always hashed too, as answers depend on them as well.
+
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    for file in _source_files(module_name):
+        digest.update(file.read_bytes())
+
+    return digest.hexdigest()
+
+
+def _source_files(module_name: str) -> list[Path]:
+    module_file = Path(sys.modules[module_name].__file__ or "")
+    files = sorted(module_file.parent.glob("*.py")) if module_file.name == "__init__.py" else [module_file]
+
+    package = Path(__file__).parent
+    shared_files = [package / "_common.py", *sorted((package / "tools").glob("*.py"))]
+
+    return files + [file for file in shared_files if file not in files]
@@ -1,21 +1,48 @@
 """Common classes used in solving AoC challenges."""
 
+import io
+import mmap
+import os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from functools import cached_property, wraps
+from itertools import islice
 from pathlib import Path
-from typing import Generator, TextIO
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Generator, Iterable, Optional, TextIO
+
+from ._cache import AnswerCache, data_digest, file_digest, source_digest
+from ._metrics import Metrics
 
 
 class Aoc(ABC):
     """Helper class for solving AoC challenges.
 
+    Input is read from file or from provided bytes, e.g. received over network.
+    It is parsed once per instance by `parse` and shared by both parts through
+    `parsed_input`. If cache is provided, parts are solved only if their answers are not cached.
+    If metrics are provided, parsing and both parts are measured in `parse`, `part_1` and `part_2` spans.
+
     Args:
-        input_file (str): Challenge input text file path.
+        input_file (str | Path | bytes): Challenge input text file path or input content.
+        cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+        metrics (Optional[Metrics], optional): Collector of solving metrics. Defaults to None.
 
     """
 
-    def __init__(self, input_file: str | Path) -> None:
+    def __init__(
+        self, input_file: str | Path | bytes, cache: Optional[AnswerCache] = None, metrics: Optional[Metrics] = None
+    ) -> None:
         self._input_file = input_file
+        self._cache = cache
+        self.metrics = metrics
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for part in ("part_1", "part_2"):
+            if part in cls.__dict__:
+                setattr(cls, part, _wrap_part(cls.__dict__[part]))
 
     @abstractmethod
     def part_1(self) -> int:
@@ -29,9 +56,208 @@ class Aoc(ABC):
 
         raise NotImplementedError
 
+    def parse(self) -> Any:
+        """Parses task input into data shared by both parts.
+
+        Defaults to whole input text. Parsed data must not be modified by parts.
+
+        """
+        with self.open_input() as file:
+            return file.read()
+
+    @cached_property
+    def parsed_input(self) -> Any:
+        """Parsed task input, computed on first access."""
+
+        if self.metrics is None:
+            return self.parse()
+
+        with self.metrics.span("parse"):
+            return self.parse()
+
+    def solve(self) -> tuple[int, int]:
+        """Solves both parts of task parsing input only once."""
+
+        return self.part_1(), self.part_2()
+
+    def cache_key(self, part: str) -> str:
+        """Key of part answer in answer cache."""
+
+        return f"{source_digest(type(self).__module__)}:{type(self).__qualname__}.{part}:{self._input_digest}"
+
+    @cached_property
+    def _input_digest(self) -> str:
+        if isinstance(self._input_file, bytes):
+            return data_digest(self._input_file)
+
+        return file_digest(self._input_file)
+
+    @classmethod
+    def solve_many(
+        cls,
+        input_files: Iterable[str | Path],
+        workers: Optional[int] = None,
+        chunksize: int = 1,
+        cache: Optional[AnswerCache] = None,
+    ) -> Generator[tuple[str | Path, tuple[int, int] | Exception], None, None]:
+        """Solves many input files on a process pool.
+
+        Worker processes are reused between input files, so imports and caches stay warm.
+        Results are yielded as soon as their chunk is solved, not in input order. Failure of one
+        input file doesn't stop solving of others, its exception is yielded instead of answers.
+
+        Args:
+            input_files (Iterable[str | Path]): Challenge input files.
+            workers (Optional[int], optional): Number of worker processes. Defaults to number of CPU cores.
+            chunksize (int, optional): Number of input files sent to worker at once. Defaults to 1.
+            cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+
+        Yields:
+            tuple[str | Path, tuple[int, int] | Exception]: Input file and answers for both parts
+                or exception raised while solving it.
+
+        """
+        from concurrent.futures import as_completed, ProcessPoolExecutor  # Slow to import, rarely needed.
+
+        input_files = iter(input_files)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_solve_files, cls, chunk, cache)
+                for chunk in iter(lambda: list(islice(input_files, chunksize)), [])
+            ]
+
+            for future in as_completed(futures):
+                yield from future.result()
+
+    @classmethod
+    async def solve_async(
+        cls, input_file: str | Path | bytes, timeout: Optional[float] = None, cache: Optional[AnswerCache] = None
+    ) -> tuple[int, int]:
+        """Solves input on process pool shared by all asynchronous solves, without blocking event loop.
+
+        Input file is read by worker process. Number of worker processes, which also limits number
+        of concurrent solves, can be set by `aoc._async.configure`.
+
+        Args:
+            input_file (str | Path | bytes): Challenge input text file path or input content.
+            timeout (Optional[float], optional): Time limit of solve including waiting for free worker [s].
+                Defaults to no limit.
+            cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+
+        Raises:
+            TimeoutError: Input wasn't solved in time.
+
+        Returns:
+            tuple[int, int]: Answers for both parts.
+
+        """
+        from . import _async  # Asyncio and process pools are slow to import, most runs don't need them.
+
+        return await _async.submit(_solve_input, cls, input_file, cache, timeout=timeout)
+
     @contextmanager
     def open_input(self) -> Generator[TextIO, None, None]:
         """Opens provided task input file."""
 
+        if isinstance(self._input_file, bytes):
+            yield io.TextIOWrapper(io.BytesIO(self._input_file), encoding="utf-8")
+            return
+
         with open(self._input_file, "rt", encoding="utf-8") as file:
             yield file
+
+    @contextmanager
+    def open_input_bytes(self) -> Generator[BinaryIO, None, None]:
+        """Opens provided task input file in binary mode."""
+
+        if isinstance(self._input_file, bytes):
+            yield io.BytesIO(self._input_file)
+            return
+
+        with open(self._input_file, "rb") as file:
+            yield file
+
+    def map_input(self) -> mmap.mmap | bytes:
+        """Maps task input file into memory as read-only bytes, without decoding and copying.
+
+        Mapping stays valid after file is closed, as long as returned object is referenced.
+        Empty bytes are returned for empty files, which can't be mapped, and provided
+        input content is returned as is. Lines are always separated by `\n` as in text mode,
+        input with `\r\n` or `\r` line endings is returned as normalized copy.
+
+        """
+        if isinstance(self._input_file, bytes):
+            return _normalize_newlines(self._input_file)
+
+        with self.open_input_bytes() as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return b""
+
+            return _normalize_newlines(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def iter_lines(self) -> Generator[str, None, None]:
+        """Streams task input file line by line, without line endings."""
+
+        with self.open_input() as file:
+            for line in file:
+                yield line.rstrip("\n")
+
+
+def _normalize_newlines(buffer: bytes | mmap.mmap) -> bytes | mmap.mmap:
+    if buffer.find(b"\r") == -1:
+        return buffer
+
+    return buffer[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def _wrap_part(part: Callable[[Aoc], int]) -> Callable[[Aoc], int]:
+    """Adds answer caching and metrics to part solving method."""
+
+    def measured(self: Aoc) -> int:
+        if self.metrics is None:
+            return part(self)
+
+        self.parsed_input  # Parsed in its own span, not in span of the first part.
+
+        with self.metrics.span(part.__name__):
+            return part(self)
+
+    @wraps(part)
+    def wrapper(self: Aoc) -> int:
+        if self._cache is None:
+            return measured(self)
+
+        key = self.cache_key(part.__name__)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if self.metrics is not None:
+                self.metrics.increment("cache_hits")
+
+            return cached.answer
+
+        start = perf_counter()
+        answer = measured(self)
+        self._cache.put(key, answer, perf_counter() - start)
+
+        return answer
+
+    return wrapper
+
+
+def _solve_input(day: type[Aoc], input_file: str | Path | bytes, cache: Optional[AnswerCache]) -> tuple[int, int]:
+    return day(input_file, cache).solve()
+
+
+def _solve_files(
+    day: type[Aoc], input_files: list[str | Path], cache: Optional[AnswerCache]
+) -> list[tuple[str | Path, tuple[int, int] | Exception]]:
+    results: list[tuple[str | Path, tuple[int, int] | Exception]] = []
+
+    for input_file in input_files:
+        try:
+            results.append((input_file, day(input_file, cache).solve()))
+        except Exception as exception:  # Returned with other results instead of losing whole chunk.
+            results.append((input_file, exception))
+
+    return results
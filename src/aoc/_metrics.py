@@ -0,0 +1,161 @@
+"""Instrumentation of challenge solving."""
+
+import json
+import os
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Generator, Iterable, Optional, TextIO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+profilers = ("cprofile", "tracemalloc")
+
+_current_metrics: ContextVar[Optional["Metrics"]] = ContextVar("current_metrics", default=None)
+
+
+class Metrics:
+    """Collects timed spans, counters and optional profiles of solving.
+
+    Args:
+        labels (Optional[dict], optional): Labels added to every exported record. Defaults to None.
+        profile (Iterable[str], optional): Profilers run in every span, `cprofile` and/or `tracemalloc`.
+            Defaults to comma separated `AOC_PROFILE` environment variable.
+        top (int, optional): Number of functions or allocation sites kept in profiles. Defaults to 10.
+
+    """
+
+    def __init__(self, labels: Optional[dict] = None, profile: Optional[Iterable[str]] = None, top: int = 10) -> None:
+        if profile is None:
+            profile = [name for name in os.environ.get("AOC_PROFILE", "").split(",") if name]
+
+        self.labels = labels or {}
+        self.profile = set(profile)
+        self.top = top
+        self.spans: dict[str, float] = {}
+        self.counters: Counter[str] = Counter()
+        self.profiles: list[dict] = []
+        self._depth = 0
+
+        unknown = self.profile - set(profilers)
+        if unknown:
+            raise ValueError(f"Unknown profilers: {', '.join(sorted(unknown))}")
+
+    @contextmanager
+    def span(self, name: str) -> Generator[None, None, None]:
+        """Measures duration of code block and activates metrics for `count` calls within it.
+
+        Nested spans are included in outer span duration and profiles, profilers run only in outermost span.
+
+        """
+        token = _current_metrics.set(self)
+        outermost = self._depth == 0
+        profiler = None
+        tracing = False
+        self._depth += 1
+
+        # Profilers are imported only when enabled to keep startup of regular runs fast.
+        if outermost and "tracemalloc" in self.profile:
+            import tracemalloc
+
+            tracing = not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+        if outermost and "cprofile" in self.profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + perf_counter() - start
+            self._depth -= 1
+
+            if profiler:
+                profiler.disable()
+                self._add_cprofile(name, profiler)
+            if tracing:
+                self._add_tracemalloc(name)
+
+            _current_metrics.reset(token)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increments counter."""
+
+        self.counters[name] += value
+
+    def records(self) -> list[dict]:
+        """Returns all collected metrics as flat records."""
+
+        records = [
+            {**self.labels, "type": "span", "name": name, "duration": duration} for name, duration in self.spans.items()
+        ]
+        records += [
+            {**self.labels, "type": "counter", "name": name, "value": value} for name, value in self.counters.items()
+        ]
+        records += [{**self.labels, **profile} for profile in self.profiles]
+
+        return records
+
+    def export(self, file: TextIO) -> None:
+        """Writes metrics to file as JSON lines."""
+
+        for record in self.records():
+            file.write(json.dumps(record) + "\n")
+
+    def _add_cprofile(self, span: str, profiler: "cProfile.Profile") -> None:
+        import pstats
+
+        stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+        top_functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[: self.top]
+
+        for (file_name, line, function), (_, calls, total_time, cumulative_time, _) in top_functions:
+            self.profiles.append(
+                {
+                    "type": "cprofile",
+                    "span": span,
+                    "function": f"{file_name}:{line}({function})",
+                    "calls": calls,
+                    "total_time": total_time,
+                    "cumulative_time": cumulative_time,
+                }
+            )
+
+    def _add_tracemalloc(self, span: str) -> None:
+        """Records traced memory of span and stops tracing."""
+
+        import tracemalloc
+
+        _, peak = tracemalloc.get_traced_memory()
+        self.profiles.append({"type": "tracemalloc", "span": span, "peak_memory": peak})
+
+        statistics = tracemalloc.take_snapshot().statistics("lineno")[: self.top]
+        for statistic in statistics:
+            frame = statistic.traceback[0]
+            self.profiles.append(
+                {
+                    "type": "tracemalloc",
+                    "span": span,
+                    "location": f"{frame.filename}:{frame.lineno}",
+                    "size": statistic.size,
+                    "count": statistic.count,
+                }
+            )
+
+        tracemalloc.stop()
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increments counter of currently measured solve, if there is one.
+
+    Hot loops should count locally and report total once, as every call has a small overhead.
+
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.increment(name, value)
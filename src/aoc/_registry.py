@@ -0,0 +1,65 @@
+"""Registry of solved days importing their modules lazily."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._common import Aoc
+
+
+class DayRegistry(Mapping[int, "type[Aoc]"]):
+    """Solution classes by day number.
+
+    Day modules (`day_<N>` modules or packages defining `Day<N>` class) are found by listing
+    package directories, without importing them. Module is imported on first access to its day,
+    so startup cost is paid only for days which are actually solved.
+
+    Args:
+        package (str): Name of package containing day modules.
+        path (Iterable[str]): Package directories.
+
+    """
+
+    def __init__(self, package: str, path: Iterable[str]) -> None:
+        self._package = package
+        self._path = list(path)
+        self._modules: dict[int, str] | None = None
+        self._classes: dict[int, type[Aoc]] = {}
+
+    @property
+    def modules(self) -> dict[int, str]:
+        """Module names by day number, found on first use."""
+
+        if self._modules is None:
+            modules = {}
+            for directory in self._path:
+                for entry in os.scandir(directory):
+                    name = entry.name.removesuffix(".py") if entry.is_file() else entry.name
+                    day = name.removeprefix("day_")
+
+                    if name.startswith("day_") and day.isdigit():
+                        modules[int(day)] = f"{self._package}.{name}"
+
+            self._modules = dict(sorted(modules.items()))
+
+        return self._modules
+
+    def __getitem__(self, day: int) -> type[Aoc]:
+        if day not in self._classes:
+            module = import_module(self.modules[day])
+            self._classes[day] = getattr(module, f"Day{day}")
+
+        return self._classes[day]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.modules)
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def __contains__(self, day: object) -> bool:
+        return day in self.modules
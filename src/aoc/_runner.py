@@ -0,0 +1,245 @@
+"""Command line runner solving multiple days in parallel."""
+
+import json
+import os
+import re
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+from . import days
+from ._cache import AnswerCache, default_cache_path
+from ._common import Aoc
+from ._metrics import Metrics, profilers
+
+day_pattern = re.compile(r"day_?(\d+)", re.IGNORECASE)
+
+
+class RunResult(NamedTuple):
+    """Answers and timings of single day run."""
+
+    day: int
+    input_file: str
+    answers: tuple[Optional[int], Optional[int]]
+    parse_time: float
+    part_times: tuple[Optional[float], Optional[float]]
+    peak_rss: Optional[int]
+    """Peak resident set size of process running the day [KiB], `None` if it can't be measured.
+
+    It is peak of the whole process lifetime, so it includes days solved earlier in the same process.
+    """
+    error: Optional[str] = None
+    metrics: tuple[dict, ...] = ()
+    """Metrics records of the run."""
+
+
+def discover_days() -> dict[int, type[Aoc]]:
+    """Imports all solved days in `aoc` package.
+
+    Use `aoc.days` registry to import only required days.
+
+    Returns:
+        dict[int, type[Aoc]]: Solution classes by day number.
+
+    """
+    return dict(days)
+
+
+def run_day(
+    day: int,
+    input_file: str,
+    parts: Sequence[int] = (1, 2),
+    cache: Optional[AnswerCache] = None,
+    profile: Optional[Sequence[str]] = None,
+) -> RunResult:
+    """Solves selected parts of single day measuring time of each phase.
+
+    Args:
+        day (int): Day number.
+        input_file (str): Challenge input file path.
+        parts (Sequence[int], optional): Parts to be solved. Defaults to (1, 2).
+        cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+        profile (Optional[Sequence[str]], optional): Profilers to run, see `Metrics`. Defaults to None.
+
+    Returns:
+        RunResult: Answers and timings.
+
+    """
+    answers: list[Optional[int]] = [None, None]
+    part_times: list[Optional[float]] = [None, None]
+    parse_time = 0.0
+    error = None
+    metrics = Metrics({"day": day, "input": input_file}, profile)
+
+    try:
+        solution = days[day](input_file, cache, metrics)
+
+        if cache is None or any(cache.get(solution.cache_key(f"part_{part}")) is None for part in parts):
+            start = perf_counter()
+            solution.parsed_input
+            parse_time = perf_counter() - start
+
+        for part in parts:
+            start = perf_counter()
+            answers[part - 1] = getattr(solution, f"part_{part}")()
+            part_times[part - 1] = perf_counter() - start
+    except Exception as exception:  # Reported in results table instead of stopping other days.
+        error = f"{type(exception).__name__}: {exception}"
+
+    return RunResult(
+        day,
+        input_file,
+        (answers[0], answers[1]),
+        parse_time,
+        (part_times[0], part_times[1]),
+        _peak_rss(),
+        error,
+        tuple(metrics.records()),
+    )
+
+
+def run_days(
+    tasks: Iterable[tuple[int, str]],
+    parts: Sequence[int] = (1, 2),
+    workers: Optional[int] = None,
+    cache: Optional[AnswerCache] = None,
+    profile: Optional[Sequence[str]] = None,
+) -> list[RunResult]:
+    """Solves days on a process pool.
+
+    Every day runs in a fresh worker process, so peak RSS of each result belongs to its day only.
+    In single process runs peak RSS of each result is the peak of all days solved so far.
+
+    Args:
+        tasks (Iterable[tuple[int, str]]): Day numbers with their input files.
+        parts (Sequence[int], optional): Parts to be solved. Defaults to (1, 2).
+        workers (Optional[int], optional): Number of worker processes. Runs in current
+            process if 1. Defaults to number of CPU cores.
+        cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+        profile (Optional[Sequence[str]], optional): Profilers to run, see `Metrics`. Defaults to None.
+
+    Returns:
+        list[RunResult]: Results ordered by day and input file.
+
+    """
+    if workers == 1:
+        results = [run_day(day, input_file, parts, cache, profile) for day, input_file in tasks]
+    else:
+        from concurrent.futures import as_completed, ProcessPoolExecutor  # Not needed in single process runs.
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), max_tasks_per_child=1) as executor:
+            futures = [executor.submit(run_day, day, input_file, parts, cache, profile) for day, input_file in tasks]
+            results = [future.result() for future in as_completed(futures)]
+
+    return sorted(results, key=lambda result: (result.day, result.input_file))
+
+
+def _peak_rss() -> Optional[int]:
+    """Returns peak resident set size of current process [KiB], `None` on platforms without `resource`."""
+
+    try:
+        import resource
+    except ImportError:  # Windows.
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return peak_rss // 1024 if sys.platform == "darwin" else peak_rss  # Reported in bytes on macOS.
+
+
+def format_results(results: Iterable[RunResult]) -> str:
+    """Formats run results as text table."""
+
+    header = ("Day", "Input", "Part 1", "Part 2", "Parse [s]", "Part 1 [s]", "Part 2 [s]", "Peak RSS [MiB]")
+    rows = [header]
+
+    for result in results:
+        rows.append(
+            (
+                str(result.day),
+                result.input_file,
+                *(str(answer) if answer is not None else "-" for answer in result.answers),
+                f"{result.parse_time:.4f}",
+                *(f"{time:.4f}" if time is not None else "-" for time in result.part_times),
+                f"{result.peak_rss / 1024:.1f}" if result.peak_rss is not None else "-",
+            )
+        )
+        if result.error:
+            rows.append(("", f"  {result.error}", "", "", "", "", "", ""))
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def collect_inputs(paths: Iterable[Path], days: Sequence[int]) -> list[tuple[int, str]]:
+    """Assigns input files to days.
+
+    Directories are expanded to files they contain. Day is read from file name (e.g. `day_5.txt`,
+    `day5_alice.txt`) unless exactly one day is selected.
+
+    Args:
+        paths (Iterable[Path]): Input files or directories.
+        days (Sequence[int]): Selected days. All days are selected if empty.
+
+    Returns:
+        list[tuple[int, str]]: Day numbers with their input files.
+
+    """
+    tasks = []
+
+    for path in paths:
+        files = sorted(file for file in path.iterdir() if file.is_file()) if path.is_dir() else [path]
+
+        for file in files:
+            match = day_pattern.search(file.name)
+            if match:
+                day = int(match.group(1))
+            elif len(days) == 1:
+                day = days[0]
+            else:
+                continue
+
+            if not days or day in days:
+                tasks.append((day, str(file)))
+
+    return tasks
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs `aoc` command."""
+
+    parser = ArgumentParser(prog="aoc", description="Solves AoC 2023 challenges.")
+    parser.add_argument("inputs", nargs="+", type=Path, help="input files or directories with `day_<N>*` files")
+    parser.add_argument("-d", "--day", type=int, action="append", default=[], help="day to solve, may be repeated")
+    parser.add_argument("-p", "--part", type=int, action="append", choices=(1, 2), help="part to solve")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes, defaults to CPU cores")
+    parser.add_argument(
+        "-c", "--cache", nargs="?", const=default_cache_path, type=Path, help="answer cache database path"
+    )
+    parser.add_argument("-m", "--metrics", type=Path, help="append metrics to file as JSON lines")
+    parser.add_argument(
+        "--profile", action="append", choices=profilers, help="profiler to run, defaults to AOC_PROFILE variable"
+    )
+    args = parser.parse_args(argv)
+
+    unknown_days = set(args.day) - set(days)
+    if unknown_days:
+        parser.error(f"unknown days: {', '.join(map(str, sorted(unknown_days)))}")
+
+    tasks = [(day, file) for day, file in collect_inputs(args.inputs, args.day) if day in days]
+    if not tasks:
+        parser.error("no input files found for selected days")
+
+    cache = AnswerCache(args.cache) if args.cache else None
+    results = run_days(tasks, args.part or (1, 2), args.workers, cache, args.profile)
+    print(format_results(results))
+
+    if args.metrics:
+        with open(args.metrics, "at", encoding="utf-8") as file:
+            for result in results:
+                file.writelines(json.dumps(record) + "\n" for record in result.metrics)
+
+    return 1 if any(result.error for result in results) else 0
@@ -1,22 +1,82 @@
+from functools import cached_property
+from mmap import mmap
+from pathlib import Path
+from typing import Optional
+
+from aoc._cache import AnswerCache
 from aoc._common import Aoc
-from ._tools import decode_cordinate
+from aoc._metrics import Metrics
+from ._tools import iter_chunks, sum_both_cordinates, sum_cordinates, sum_file_cordinates
 
 
 class Day1(Aoc):
+    """Trebuchet calibration.
+
+    Lines are decoded directly from mapped input bytes. As every line is independent, input can be
+    split into chunks of whole lines decoded in parallel by worker processes, which read their chunks
+    from input file themselves. Workers decode both parts in a single pass, shared by both parts.
+
+    Args:
+        input_file (str | Path | bytes): Challenge input text file path or input content.
+        cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+        metrics (Optional[Metrics], optional): Collector of solving metrics. Defaults to None.
+        workers (Optional[int], optional): Number of worker processes, input is decoded in current
+            process if 1. Defaults to 1.
+        chunk_size (int, optional): Minimal size of chunk decoded by worker [B]. Defaults to 16 MiB.
+
+    """
+
+    def __init__(
+        self,
+        input_file: str | Path | bytes,
+        cache: Optional[AnswerCache] = None,
+        metrics: Optional[Metrics] = None,
+        workers: Optional[int] = 1,
+        chunk_size: int = 1 << 24,
+    ) -> None:
+        super().__init__(input_file, cache, metrics)
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def parse(self) -> bytes | mmap:
+        return self.map_input()
+
     def part_1(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
-            cordinate_sum = 0
-            for line in lines:
-                cordinate_sum += decode_cordinate(line)
+        if self._parallel:
+            return self._parallel_sums[0]
 
-            return cordinate_sum
+        return sum_cordinates(self.parsed_input)
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
-            cordinate_sum = 0
-            for line in lines:
-                cordinate_sum += decode_cordinate(line, parse_text=True)
+        if self._parallel:
+            return self._parallel_sums[1]
+
+        return sum_cordinates(self.parsed_input, parse_text=True)
+
+    @cached_property
+    def _chunks(self) -> list[tuple[int, int]]:
+        return list(iter_chunks(self.parsed_input, self.chunk_size))
+
+    @property
+    def _parallel(self) -> bool:
+        return self.workers != 1 and len(self._chunks) > 1
+
+    @cached_property
+    def _parallel_sums(self) -> tuple[int, int]:
+        """Sums of both parts decoded in single parallel pass, each chunk is sent to workers once."""
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        buffer = self.parsed_input
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            if not isinstance(buffer, mmap):  # Provided or normalized input, not readable from file.
+                futures = [executor.submit(sum_both_cordinates, buffer[start:end]) for start, end in self._chunks]
+            else:
+                futures = [
+                    executor.submit(sum_file_cordinates, self._input_file, start, end) for start, end in self._chunks
+                ]
+
+            sums = [future.result() for future in futures]
 
-            return cordinate_sum
+        return sum(digits_sum for digits_sum, _ in sums), sum(text_sum for _, text_sum in sums)
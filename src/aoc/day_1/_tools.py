@@ -1,4 +1,8 @@
+import mmap
 import re
+from functools import cache
+from pathlib import Path
+from typing import Generator, Optional
 
 numbers_text = {
     "one": 1,
@@ -12,20 +16,31 @@ numbers_text = {
     "nine": 9,
 }
 
-digits_pattern = re.compile(r"\d")
-string_pattern = re.compile(rf"(?=(\d|{'|'.join(list(numbers_text))}))")
 
+digits_values = {**numbers_text, **{str(digit): digit for digit in range(10)}}
+"""Values of digits in text and numeric form."""
 
-def _convert_match(text: str) -> int:
-    try:
-        return int(text)
-    except ValueError:
-        return numbers_text[text]
+_encoded_digits_values = {digit.encode(): value for digit, value in digits_values.items()}
+
+
+@cache
+def _get_patterns(parse_text: bool) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compiles patterns matching first and last digit on first use, so importing module stays cheap.
+
+    Last digit pattern starts with greedy `.*`, so regex engine scans line backwards from its end
+    and stops at first digit found.
+
+    """
+    digit = rf"\d|{'|'.join(numbers_text)}" if parse_text else r"\d"
+
+    return re.compile(digit), re.compile(rf".*({digit})")
 
 
 def decode_cordinate(encoded_cordinate: str, /, parse_text: bool = False) -> int:
     """Decodes cordinate from string encoded data.
 
+    Only first and last digit are searched for, other digits in between are never matched.
+
     Example:
         a1b2c3d4e5f -> 15
 
@@ -33,14 +48,107 @@ def decode_cordinate(encoded_cordinate: str, /, parse_text: bool = False) -> int
         encoded_cordinate (str): Encoded cordinate data.
         parse_text (bool, optional): Decides if digits in text form should be parsed. Defaults to False.
 
+    Raises:
+        ValueError: Encoded data contains no digits.
+
     Returns:
         int: Parsed cordinate.
 
     """
-    matches = re.findall(
-        string_pattern if parse_text else digits_pattern, encoded_cordinate
-    )
-    numbers = list(map(_convert_match, matches))
-    cordinate = 10 * numbers[0] + numbers[-1]
+    first_pattern, last_pattern = _get_patterns(parse_text)
+
+    first = first_pattern.search(encoded_cordinate)
+    if first is None:
+        raise ValueError(f"No digits in {encoded_cordinate!r}.")
+
+    last = last_pattern.match(encoded_cordinate, first.start())
+    cordinate = 10 * digits_values[first.group()] + digits_values[last.group(1)]  # type: ignore[union-attr]
 
     return cordinate
+
+
+@cache
+def _get_lines_pattern(parse_text: bool) -> re.Pattern[bytes]:
+    """Compiles pattern matching first and last digit of every non-empty line in buffer.
+
+    First digit is matched in lookahead, so last digit may overlap it, e.g. in `oneight`.
+    Lines without digits are matched too, with empty digit groups.
+
+    """
+    digit = rf"\d|{'|'.join(numbers_text)}" if parse_text else r"\d"
+
+    return re.compile(rf"^(?:.*?(?=({digit})).*({digit})|(?=.))".encode(), re.MULTILINE)
+
+
+def sum_cordinates(
+    buffer: bytes | mmap.mmap, parse_text: bool = False, start: int = 0, end: Optional[int] = None
+) -> int:
+    """Sums cordinates encoded in lines of buffer, without decoding it to text.
+
+    Empty lines are skipped.
+
+    Args:
+        buffer (bytes | mmap.mmap): Newline separated encoded cordinates.
+        parse_text (bool, optional): Decides if digits in text form should be parsed. Defaults to False.
+        start (int, optional): Index of first decoded line start. Defaults to 0.
+        end (Optional[int], optional): Index of last decoded line end. Defaults to buffer end.
+
+    Raises:
+        ValueError: Line contains no digits.
+
+    Returns:
+        int: Sum of cordinates.
+
+    """
+    pattern = _get_lines_pattern(parse_text)
+    values = _encoded_digits_values
+    end = len(buffer) if end is None else end
+
+    matches = pattern.finditer(buffer, start, end)
+
+    try:
+        return sum(10 * values[match[1]] + values[match[2]] for match in matches)
+    except KeyError:  # Digit groups of line without digits are empty.
+        line_start = next(match.start() for match in pattern.finditer(buffer, start, end) if match[1] is None)
+        line_end = buffer.find(b"\n", line_start, end)
+        line = buffer[line_start : end if line_end == -1 else line_end]
+
+        raise ValueError(f"No digits in {line.decode()!r}.") from None
+
+
+def sum_both_cordinates(buffer: bytes | mmap.mmap, start: int = 0, end: Optional[int] = None) -> tuple[int, int]:
+    """Sums cordinates encoded in lines of buffer for both parts, see `sum_cordinates`.
+
+    Returns:
+        tuple[int, int]: Sums of cordinates with numeric digits only and with digits in text form.
+
+    """
+    return sum_cordinates(buffer, False, start, end), sum_cordinates(buffer, True, start, end)
+
+
+def iter_chunks(buffer: bytes | mmap.mmap, chunk_size: int) -> Generator[tuple[int, int], None, None]:
+    """Splits buffer into chunks of whole lines.
+
+    Args:
+        buffer (bytes | mmap.mmap): Newline separated lines.
+        chunk_size (int): Minimal chunk size [B], chunks are extended to the end of line.
+
+    Yields:
+        tuple[int, int]: Start and end index of chunk.
+
+    """
+    start = 0
+    while start < len(buffer):
+        end = buffer.find(b"\n", start + chunk_size - 1)
+        end = len(buffer) if end == -1 else end + 1
+
+        yield start, end
+        start = end
+
+
+def sum_file_cordinates(path: str | Path, start: int, end: int) -> tuple[int, int]:
+    """Sums cordinates encoded in lines of file part for both parts, see `sum_both_cordinates`."""
+
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return sum_both_cordinates(buffer, start, end)
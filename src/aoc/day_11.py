@@ -6,11 +6,15 @@ from ._common import Aoc
 
 
 class Day11(Aoc):
-    def part_1(self):
+    def parse(self) -> tuple[str, list[Coordinate]]:
         with self.open_input() as file:
             universe_map = file.read()
 
-        galaxies = find_galaxies(universe_map)
+        return universe_map, find_galaxies(universe_map)
+
+    def part_1(self):
+        universe_map, galaxies = self.parsed_input
+
         expanded_galaxies = expand_cordinates(galaxies, universe_map)
 
         pairs = set(combinations(expanded_galaxies, 2))
@@ -20,10 +24,8 @@ class Day11(Aoc):
         return total_length
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            universe_map = file.read()
+        universe_map, galaxies = self.parsed_input
 
-        galaxies = find_galaxies(universe_map)
         expanded_galaxies = expand_cordinates(galaxies, universe_map, 1000000)
 
         pairs = set(combinations(expanded_galaxies, 2))
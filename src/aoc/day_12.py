@@ -1,39 +1,31 @@
 import re
 from functools import cache
-from itertools import chain, repeat
+from itertools import repeat
+from typing import Iterable, Iterator
 
 from ._common import Aoc
 
 
 class Day12(Aoc):
-    def part_1(self):
-        with self.open_input() as file:
-            condition_records = file.read().splitlines()
+    def parse(self) -> None:
+        """Records are streamed by each part, so whole input is never loaded."""
 
-            total_combinations = 0
-            for record in condition_records:
-                data, nums = record.split(" ")
-                nums = tuple(int(num) for num in nums.split(","))
+        return None
 
-                total_combinations += count_combinations(data, nums)
-
-        return total_combinations
+    def part_1(self) -> int:
+        return sum(count_combinations(data, nums) for data, nums in _parse_records(self.iter_lines()))
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            condition_records = file.read().splitlines()
-
-            total_combinations = 0
-            for record in condition_records:
-                data, nums = record.split(" ")
-                nums = tuple(int(num) for num in nums.split(","))
-
-                data = "?".join(repeat(data, 5))
-                nums = tuple(chain.from_iterable(repeat(nums, 5)))
+        return sum(
+            count_combinations("?".join(repeat(data, 5)), nums * 5)
+            for data, nums in _parse_records(self.iter_lines())
+        )
 
-                total_combinations += count_combinations(data, nums)
 
-        return total_combinations
+def _parse_records(condition_records: Iterable[str]) -> Iterator[tuple[str, tuple[int, ...]]]:
+    for record in condition_records:
+        data, nums = record.split(" ")
+        yield data, tuple(int(num) for num in nums.split(","))
 
 
 @cache
@@ -1,4 +1,5 @@
-from typing import Optional
+from mmap import mmap
+from typing import Iterator, Optional
 
 from aoc.tools.coordinates import Coordinate
 
@@ -6,52 +7,47 @@ from ._common import Aoc
 
 
 class Day13(Aoc):
-    def part_1(self):
-        with self.open_input() as file:
-            valley_map = file.read()
-            patterns = valley_map.split("\n\n")
+    def parse(self) -> list[bytes]:
+        return list(_split_patterns(self.map_input()))
 
-            total = 0
-            for pattern in patterns:
-                horizontal, vertical = _find_all_reflections(pattern)
+    def part_1(self):
+        total = 0
+        for pattern in self.parsed_input:
+            horizontal, vertical = _find_all_reflections(pattern)
 
-                total += sum(reflection + 1 for reflection in vertical) + sum(
-                    (reflection + 1) * 100 for reflection in horizontal
-                )
+            total += sum(reflection + 1 for reflection in vertical) + sum(
+                (reflection + 1) * 100 for reflection in horizontal
+            )
 
         return total
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            valley_map = file.read()
-            patterns = valley_map.split("\n\n")
-
-            total = 0
-            for pattern in patterns:
-                horizontal, vertical = _find_all_reflections(pattern)
-                horizontal_2, vertical_2 = _find_all_reflections(pattern, True)
+        total = 0
+        for pattern in self.parsed_input:
+            horizontal, vertical = _find_all_reflections(pattern)
+            horizontal_2, vertical_2 = _find_all_reflections(pattern, True)
 
-                horizontal_diffs = set(horizontal_2) - set(horizontal)
-                vertical_diffs = set(vertical_2) - set(vertical)
+            horizontal_diffs = set(horizontal_2) - set(horizontal)
+            vertical_diffs = set(vertical_2) - set(vertical)
 
-                horizontal_sum = sum(
-                    (reflection + 1) * 100 for reflection in horizontal_diffs
-                )
-                vertical_sum = sum(reflection + 1 for reflection in vertical_diffs)
+            horizontal_sum = sum(
+                (reflection + 1) * 100 for reflection in horizontal_diffs
+            )
+            vertical_sum = sum(reflection + 1 for reflection in vertical_diffs)
 
-                total += horizontal_sum + vertical_sum
+            total += horizontal_sum + vertical_sum
 
         return total
 
 
 def check_for_reflection(
-    index: int, rows: list[str], fix_smudge: bool = False
+    index: int, rows: list[bytes], fix_smudge: bool = False
 ) -> tuple[bool, Optional[Coordinate]]:
     """Checks if reflections occurs at given index.
 
     Args:
         index (int): Index of reflection
-        rows (list[str]): Valley map.
+        rows (list[bytes]): Valley map.
         fix_smudge (bool, optional): Decides if smudged mirors should be fixed. Defaults to False.
 
     Returns:
@@ -89,8 +85,8 @@ def check_for_reflection(
 
 
 def find_reflections(
-    rows: list[str], allow_smudges: bool = False
-) -> tuple[list[int], list[str]]:
+    rows: list[bytes], allow_smudges: bool = False
+) -> tuple[list[int], list[bytes]]:
     reflections = []
     for index in range(len(rows)):
         reflection, smudge = check_for_reflection(index, rows, allow_smudges)
@@ -98,7 +94,7 @@ def find_reflections(
             allow_smudges = False
             rows[smudge.row] = (
                 rows[smudge.row][: smudge.position]
-                + ("." if rows[smudge.row][smudge.position] == "#" else "#")
+                + (b"." if rows[smudge.row][smudge.position] == ord("#") else b"#")
                 + rows[smudge.row][smudge.position + 1 :]
             )  # Replace smudged mirror in map.
         if reflection and not allow_smudges:
@@ -108,11 +104,22 @@ def find_reflections(
 
 
 def _find_all_reflections(
-    pattern: str, allow_smudges: bool = False
+    pattern: bytes, allow_smudges: bool = False
 ) -> tuple[list[int], list[int]]:
     rows = pattern.splitlines()
     horizontal_reflections, rows = find_reflections(rows, allow_smudges)
-    columns = list("".join(row) for row in zip(*rows))
+    columns = list(bytes(column) for column in zip(*rows))
     vertical_reflections, _ = find_reflections(columns, allow_smudges)
 
     return horizontal_reflections, vertical_reflections
+
+
+def _split_patterns(valley_map: bytes | mmap) -> Iterator[bytes]:
+    start = 0
+    while start < len(valley_map):
+        end = valley_map.find(b"\n\n", start)
+        if end == -1:
+            end = len(valley_map)
+
+        yield valley_map[start:end]
+        start = end + 2
@@ -1,51 +1,53 @@
 from collections import defaultdict
-from enum import auto, Enum, StrEnum
+from enum import auto, Enum
 from typing import cast, Hashable, Optional
 
 from aoc.tools.coordinates import Direction
+from aoc.tools.grid import Grid
 from ._common import Aoc
 
 
 class Day14(Aoc):
+    def parse(self) -> bytes:
+        return self.map_input()[:]
+
     def part_1(self):
-        with self.open_input() as file:
-            platform = file.read()
-            platform = tilt_platform(platform, Direction.UP)
+        platform = Grid(bytearray(self.parsed_input))
+        tilt_platform(platform, Direction.UP)
 
         return calculate_load(platform)
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            platform = file.read()
+        platform = Grid(bytearray(self.parsed_input))
 
-            repetitions_finder = RepetitionFinder()
-            iterations = 1000000000
+        repetitions_finder = RepetitionFinder()
+        iterations = 1000000000
 
-            for _ in range(iterations):
-                old_platform = str(platform)
+        for _ in range(iterations):
+            old_platform = platform.tobytes()
 
-                platform = _spin_cycle(platform)
+            _spin_cycle(platform)
 
-                repetitions_finder.add_element(old_platform, platform)
+            repetitions_finder.add_element(old_platform, platform.tobytes())
 
-                if repetitions_finder.repetition:
-                    repetition_start, repetitions = repetitions_finder.repetition
-                    final_pattern_index = (iterations - repetition_start - 1) % len(
-                        repetitions
-                    )
-                    final_valley = repetitions[final_pattern_index]
-                    final_valley = cast(str, final_valley)
-                    platform = _spin_cycle(final_valley)
-                    break
+            if repetitions_finder.repetition:
+                repetition_start, repetitions = repetitions_finder.repetition
+                final_pattern_index = (iterations - repetition_start - 1) % len(
+                    repetitions
+                )
+                final_valley = repetitions[final_pattern_index]
+                platform = Grid(bytearray(cast(bytes, final_valley)))
+                _spin_cycle(platform)
+                break
 
         return calculate_load(platform)
 
 
-class Stone(StrEnum):
+class Stone(bytes, Enum):
     """Type of stone."""
 
-    ROUND = "O"
-    SQUARE = "#"
+    ROUND = b"O"
+    SQUARE = b"#"
 
 
 class RepetitionFinder:
@@ -89,8 +91,9 @@ class RepetitionFinder:
             # Pattern starts when vertex with more than one repetiton shows up
             self._pattern_started = True
 
-        if twos and threes == 1:
-            # Pattern ends when first vertex with three repetitions shows up
+        if threes == 1:
+            # Pattern ends when first vertex with three repetitions shows up,
+            # there are no vertices with two repetitions for single element pattern.
             self._state = RepetitionFinder._FinderState.FINISHED
 
     def _get_vertex_by_repetitions(self, repetitions: int) -> list[Hashable]:
@@ -103,51 +106,37 @@ class RepetitionFinder:
         ]
 
 
-def tilt_platform(platform: str, direction: Direction) -> str:
-    """Tilts platform in specified directions causing boulders (`O`) to roll.
+def tilt_platform(platform: Grid, direction: Direction) -> None:
+    """Tilts platform in place in specified directions causing boulders (`O`) to roll.
 
     Args:
-        platform (str): Platform to be tilted.
+        platform (Grid): Platform to be tilted.
         direction (Direction): Tilting direction.
 
-    Returns:
-        str: Tilted platform.
-
     """
-    rows = platform.splitlines()
-
-    if direction.is_vertical():
-        rows = ["".join(row) for row in zip(*rows)]
+    lines = platform.columns() if direction.is_vertical() else platform.rows()
+    towards_start = direction in {Direction.UP, Direction.LEFT}
 
-    tilted_rows = [
-        Stone.SQUARE.join(
-            "".join(
-                sorted(
-                    group, reverse=direction not in {Direction.RIGHT, Direction.DOWN}
-                )
-            )
-            for group in row.split(Stone.SQUARE)
-        )
-        for row in rows
-    ]  # Splits rows by # and sorts remaining characters to achieve tiling effect.
+    for line in lines:
+        groups = []
+        # Splits line by # and moves round stones to one end of each group to achieve tilting effect.
+        for group in line.tobytes().split(Stone.SQUARE):
+            round_stones = group.count(Stone.ROUND)
+            empty = b"." * (len(group) - round_stones)
+            groups.append(Stone.ROUND * round_stones + empty if towards_start else empty + Stone.ROUND * round_stones)
 
-    if direction.is_vertical():
-        tilted_rows = ["".join(row) for row in zip(*tilted_rows)]
+        line[:] = Stone.SQUARE.join(groups)
 
-    return "\n".join(tilted_rows)
 
-
-def calculate_load(platform: str) -> int:
+def calculate_load(platform: Grid) -> int:
     """Calculates load on platform."""
 
     return sum(
-        (index + 1) * row.count(Stone.ROUND)
-        for index, row in enumerate(reversed(platform.splitlines()))
+        (platform.height - index) * row.tobytes().count(Stone.ROUND)
+        for index, row in enumerate(platform.rows())
     )
 
 
-def _spin_cycle(platform: str) -> str:
+def _spin_cycle(platform: Grid) -> None:
     for direction in (Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT):
-        platform = tilt_platform(platform, direction)
-
-    return platform
+        tilt_platform(platform, direction)
@@ -5,35 +5,32 @@ from ._common import Aoc
 
 
 class Day15(Aoc):
-    def part_1(self):
+    def parse(self) -> list[str]:
         with self.open_input() as file:
-            sequence = file.read().rstrip("\n")
-            steps = sequence.split(",")
+            return file.read().rstrip("\n").split(",")
 
-        return sum(calculate_hash(step) for step in steps)
+    def part_1(self):
+        return sum(calculate_hash(step) for step in self.parsed_input)
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            sequence = file.read().rstrip("\n")
-
-            boxes: defaultdict[int, OrderedDict[str, int]] = defaultdict(
-                OrderedDict[str, int]
-            )
-
-            for step in sequence.split(","):
-                label, focal = step.split("-") if "-" in step else step.split("=")
-                box = calculate_hash(label)
-
-                if focal:
-                    boxes[box][label] = int(focal)
-                else:
-                    if label in boxes[box]:
-                        del boxes[box][label]
-
-            total_power = 0
-            for box, lenses in boxes.items():
-                for index, lens in enumerate(lenses.values()):
-                    total_power += (box + 1) * (index + 1) * lens
+        boxes: defaultdict[int, OrderedDict[str, int]] = defaultdict(
+            OrderedDict[str, int]
+        )
+
+        for step in self.parsed_input:
+            label, focal = step.split("-") if "-" in step else step.split("=")
+            box = calculate_hash(label)
+
+            if focal:
+                boxes[box][label] = int(focal)
+            else:
+                if label in boxes[box]:
+                    del boxes[box][label]
+
+        total_power = 0
+        for box, lenses in boxes.items():
+            for index, lens in enumerate(lenses.values()):
+                total_power += (box + 1) * (index + 1) * lens
 
         return total_power
 
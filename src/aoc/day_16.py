@@ -1,7 +1,19 @@
 from dataclasses import dataclass
+from enum import StrEnum
 
+from . import _metrics
 from ._common import Aoc
 from .tools.coordinates import Coordinate, Direction
+from .tools.grid import Grid
+
+
+class Obstacle(StrEnum):
+    """Type of obstacle in beam path."""
+
+    LINE = "|"
+    MINUS = "-"
+    MIRROR_A = "/"
+    MIRROR_B = "\\"
 
 
 @dataclass
@@ -14,118 +26,142 @@ class Beam:
     def coordinates(self) -> tuple[Coordinate, ...]:
         """All coordinates occupied by beam."""
 
-        return tuple(self.start + (self.direction.value * i) for i in range(self.length + 1))
+        return tuple(self.start + (self.direction.delta * i) for i in range(self.length + 1))
 
 
 class Day16(Aoc):
+    def parse(self) -> Grid:
+        return Grid(self.map_input())
+
     def part_1(self):
-        with self.open_input() as file:
-            mirrors_map = file.read()
+        mirrors_map = self.parsed_input
 
-            start = Coordinate(0, -1)
+        start = Coordinate(0, -1)
 
-            beams = propagate_beam(start, Direction.RIGHT, mirrors_map, set())
+        beams = propagate_beam(start, Direction.RIGHT, mirrors_map, set())
 
-            energized_tiles = set(coordinate for beam in beams for coordinate in beam.coordinates)
-            energized_tiles.remove(start)
+        energized_tiles = set(coordinate for beam in beams for coordinate in beam.coordinates)
+        energized_tiles.remove(start)
 
         return len(energized_tiles)
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            mirrors_map = file.read()
+        mirrors_map = self.parsed_input
 
-            all_energized_tiles = []
+        all_energized_tiles = []
 
-            vertical_len = len(mirrors_map.splitlines())
-            horizontal_len = len(mirrors_map.splitlines()[0])
+        vertical_len, horizontal_len = mirrors_map.height, mirrors_map.width
 
-            right = [Coordinate(i, -1) for i in range(vertical_len)], Direction.RIGHT
-            left = [Coordinate(i, horizontal_len) for i in range(vertical_len)], Direction.LEFT
-            down = [Coordinate(-1, i) for i in range(horizontal_len)], Direction.DOWN
-            up = [Coordinate(vertical_len, i) for i in range(horizontal_len)], Direction.UP
+        right = [Coordinate(i, -1) for i in range(vertical_len)], Direction.RIGHT
+        left = [Coordinate(i, horizontal_len) for i in range(vertical_len)], Direction.LEFT
+        down = [Coordinate(-1, i) for i in range(horizontal_len)], Direction.DOWN
+        up = [Coordinate(vertical_len, i) for i in range(horizontal_len)], Direction.UP
 
-            for start, direction in [
-                (coordinate, direction)
-                for coordinates, direction in [right, left, down, up]
-                for coordinate in iter(coordinates)
-            ]:
-                beams = propagate_beam(start, direction, mirrors_map, set())
+        for start, direction in [
+            (coordinate, direction)
+            for coordinates, direction in [right, left, down, up]
+            for coordinate in iter(coordinates)
+        ]:
+            beams = propagate_beam(start, direction, mirrors_map, set())
 
-                energized_tiles = set(coordinate for beam in beams for coordinate in beam.coordinates)
-                energized_tiles.remove(start)
+            energized_tiles = set(coordinate for beam in beams for coordinate in beam.coordinates)
+            energized_tiles.remove(start)
 
-                all_energized_tiles.append(len(energized_tiles))
+            all_energized_tiles.append(len(energized_tiles))
 
         return max(all_energized_tiles)
 
 
 def propagate_beam(
-    start: Coordinate, direction: Direction, mirrors_map: str, already_propagated: set[tuple[Coordinate, Direction]]
+    start: Coordinate,
+    direction: Direction,
+    mirrors_map: Grid,
+    already_propagated: set[tuple[Coordinate, Direction]],
 ) -> list[Beam]:
-    already_propagated.add((start, direction))
+    """Propagates beam through mirrors map, splitting and reflecting it on obstacles.
+
+    Args:
+        start (Coordinate): Beam start, may be outside of map.
+        direction (Direction): Beam direction.
+        mirrors_map (Grid): Mirrors map.
+        already_propagated (set[tuple[Coordinate, Direction]]): Starts and directions of already
+            propagated beams, which are skipped. Updated with propagated beams.
+
+    Returns:
+        list[Beam]: Straight beam parts.
 
-    map_rows = mirrors_map.splitlines()
+    """
     beams = []
+    pending = [(start, direction)]
+    propagations = 0
 
-    if direction.is_vertical():
-        row = "".join([row[start.position] for row in map_rows])
-        leftover = row[: start.row] if direction == direction.UP else row[start.row + 1 :]
-    else:
-        row = map_rows[start.row]
-        leftover = row[: start.position] if direction == direction.LEFT else row[start.position + 1 :]
+    # Beams are propagated from stack instead of recursively, as large maps exceed recursion limit.
+    while pending:
+        start, direction = pending.pop()
+        propagations += 1
 
-    if leftover:
+        if (start, direction) in already_propagated:
+            continue
+
+        already_propagated.add((start, direction))
+
+        if direction.is_vertical():
+            line, index = mirrors_map.column(start.position), start.row
+        else:
+            line, index = mirrors_map.row(start.row), start.position
+
+        leftover = line[:index] if direction in {Direction.UP, Direction.LEFT} else line[index + 1 :]
+
+        if not leftover:
+            continue
+
+        path = leftover.tobytes()
         if direction in {Direction.UP, Direction.LEFT}:
-            leftover = leftover[::-1]
+            path = path[::-1]
 
-        obstacles = leftover.replace(".", "")
+        obstacles = path.replace(b".", b"")
 
         if obstacles:
-            obstacle = obstacles[0]
-            obstacle_diff = leftover.find(obstacle) + 1
-            obstacle_coordinate = start + direction.value * obstacle_diff
+            obstacle = Obstacle(chr(obstacles[0]))
+            obstacle_diff = path.find(obstacles[0]) + 1
+            obstacle_coordinate = start + direction.delta * obstacle_diff
 
-            beam = Beam(start, obstacle_diff, direction)
-            beams.append(beam)
+            beams.append(Beam(start, obstacle_diff, direction))
 
-            propagated = (
-                propagate_beam(obstacle_coordinate, direction, mirrors_map, already_propagated)
-                for direction in calculate_directions(direction, obstacle)
-                if (obstacle_coordinate, direction) not in already_propagated
+            pending.extend(
+                (obstacle_coordinate, new_direction)
+                for new_direction in reversed(calculate_directions(direction, obstacle))
+                if (obstacle_coordinate, new_direction) not in already_propagated
             )
-
-            for propagate in propagated:
-                beams.extend(propagate)
-
         else:
-            beam = Beam(start, len(leftover), direction)
-            beams.append(beam)
+            beams.append(Beam(start, len(path), direction))
+
+    _metrics.count("beam_propagations", propagations)
 
     return beams
 
 
-def calculate_directions(beam_direction: Direction, obstacle: str) -> tuple[Direction]:
+def calculate_directions(beam_direction: Direction, obstacle: Obstacle) -> tuple[Direction]:
     match obstacle:
-        case "|":
+        case Obstacle.LINE:
             new_directions = (
                 (Direction.UP, Direction.DOWN)
                 if beam_direction in {Direction.LEFT, Direction.RIGHT}
                 else (beam_direction,)
             )
-        case "-":
+        case Obstacle.MINUS:
             new_directions = (
                 (Direction.LEFT, Direction.RIGHT)
                 if beam_direction in {Direction.UP, Direction.DOWN}
                 else (beam_direction,)
             )
-        case "/":
+        case Obstacle.MIRROR_A:
             new_directions = (
                 beam_direction.rotate()
                 if beam_direction in {Direction.UP, Direction.DOWN}
                 else beam_direction.rotate(False),
             )
-        case "\\":
+        case Obstacle.MIRROR_B:
             new_directions = (
                 beam_direction.rotate(False)
                 if beam_direction in {Direction.UP, Direction.DOWN}
@@ -2,8 +2,10 @@ from collections import defaultdict
 from heapq import heappush, heappop
 from typing import Self, NamedTuple
 
+from . import _metrics
 from ._common import Aoc
 from .tools.coordinates import Coordinate, Direction
+from .tools.grid import Grid
 
 
 class Node(NamedTuple):
@@ -42,30 +44,27 @@ class UltraNode(Node):
 
 
 class Day17(Aoc):
-    def part_1(self):
-        with self.open_input() as file:
-            traffic_map = file.read()
+    def parse(self) -> tuple[Grid, Coordinate]:
+        traffic_map = Grid(self.map_input())
+
+        return traffic_map, Coordinate(traffic_map.height - 1, traffic_map.width - 1)
 
-            start = Coordinate(0, 0)
-            end = Coordinate(len(traffic_map.splitlines()) - 1, len(traffic_map.splitlines()[0]) - 1)
+    def part_1(self):
+        traffic_map, end = self.parsed_input
 
-            length = shortest_path(start, end, traffic_map)
+        length = shortest_path(Coordinate(0, 0), end, traffic_map)
 
         return length
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            traffic_map = file.read()
-
-            start = Coordinate(0, 0)
-            end = Coordinate(len(traffic_map.splitlines()) - 1, len(traffic_map.splitlines()[0]) - 1)
+        traffic_map, end = self.parsed_input
 
-            length = shortest_path(start, end, traffic_map, ultra=True)
+        length = shortest_path(Coordinate(0, 0), end, traffic_map, ultra=True)
 
         return length
 
 
-def shortest_path(start: Coordinate, finish: Coordinate, traffic_map: str, ultra: bool = False) -> int:
+def shortest_path(start: Coordinate, finish: Coordinate, traffic_map: Grid, ultra: bool = False) -> int:
     _Node = UltraNode if ultra else Node
 
     visited_nodes: set[tuple[int, Node]] = set()
@@ -73,19 +72,21 @@ def shortest_path(start: Coordinate, finish: Coordinate, traffic_map: str, ultra
     next_nodes: list[tuple[int, Node]] = []
 
     for direction in {Direction.RIGHT, Direction.DOWN}:
-        node = (_get_cost(start + direction.value, traffic_map), _Node(start + direction.value, direction, 1))
+        node = (_get_cost(start + direction.delta, traffic_map), _Node(start + direction.delta, direction, 1))
         heappush(next_nodes, node)
 
+    pushes = len(next_nodes)
     while len(next_nodes):
         cost, node = heappop(next_nodes)
 
         visited_nodes.add((cost, node))
 
         if node.location == finish:
+            _metrics.count("heap_pushes", pushes)
             return cost
 
         for direction in node.possible_directions:
-            new_cord = node.location + direction.value
+            new_cord = node.location + direction.delta
 
             if start.position <= new_cord.position <= finish.position and start.row <= new_cord.row <= finish.row:
                 steps = node.steps + 1 if direction == node.direction else 1
@@ -96,7 +97,8 @@ def shortest_path(start: Coordinate, finish: Coordinate, traffic_map: str, ultra
                 if new_cost < heat_loss[new_node]:
                     heat_loss[new_node] = new_cost
                     heappush(next_nodes, new_location)
+                    pushes += 1
 
 
-def _get_cost(coordinate: Coordinate, traffic_map: str) -> int:
-    return int(traffic_map.splitlines()[coordinate.row][coordinate.position])
+def _get_cost(coordinate: Coordinate, traffic_map: Grid) -> int:
+    return traffic_map[coordinate] - ord("0")
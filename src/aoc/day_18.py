@@ -1,4 +1,3 @@
-from itertools import accumulate
 from typing import NamedTuple
 
 from ._common import Aoc
@@ -6,41 +5,24 @@ from .tools.coordinates import Coordinate, Direction
 
 
 class Day18(Aoc):
-    def part_1(self):
-        with self.open_input() as file:
-            steps = [_parse_step(step) for step in file.read().splitlines()]
+    def parse(self) -> None:
+        """Steps are streamed by each part, so whole input is never loaded."""
 
-            vertices = list(
-                accumulate(
-                    steps,
-                    lambda coordinate, step: coordinate + step.direction.value * step.length,
-                    initial=Coordinate(0, 0),
-                )
-            )[1:]
-            edges = sum([step.length for step in steps])
+        return None
 
-            area = calculate_area(vertices)
-            inside = area - (edges / 2) + 1  # Pick's theorem
+    def part_1(self) -> int:
+        lagoon = Lagoon()
+        for step in self.iter_lines():
+            lagoon.dig(_parse_step(step))
 
-        return int(inside + edges)
+        return lagoon.volume
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            steps = [_parse_step(step, True) for step in file.read().splitlines()]
+        lagoon = Lagoon()
+        for step in self.iter_lines():
+            lagoon.dig(_parse_step(step, True))
 
-            vertices = list(
-                accumulate(
-                    steps,
-                    lambda coordinate, step: coordinate + step.direction.value * step.length,
-                    initial=Coordinate(0, 0),
-                )
-            )[1:]
-            edges = sum([step.length for step in steps])
-
-            area = calculate_area(vertices)
-            inside = area - (edges / 2) + 1  # Pick's theorem
-
-        return int(inside + edges)
+        return lagoon.volume
 
 
 class Step(NamedTuple):
@@ -48,15 +30,30 @@ class Step(NamedTuple):
     length: int
 
 
-def calculate_area(vertices: list[Coordinate]) -> int:
-    """Calculates area using shoelace algorithm.
+class Lagoon:
+    """Accumulates area of lagoon dug step by step, without storing its vertices."""
+
+    __slots__ = ("double_area", "edges", "vertex")
+
+    def __init__(self) -> None:
+        self.double_area = 0
+        self.edges = 0
+        self.vertex = Coordinate(0, 0)
+
+    def dig(self, step: Step) -> None:
+        """Digs edge from last vertex."""
 
-    Vertices must go in the same direction.
+        vertex = self.vertex
+        next_vertex = vertex + step.direction.delta * step.length
+        self.double_area += vertex.row * next_vertex.position - next_vertex.row * vertex.position  # Shoelace
+        self.edges += step.length
+        self.vertex = next_vertex
 
-    """
-    x, y = zip(*[(c.row, c.position) for c in vertices])
+    @property
+    def volume(self) -> int:
+        """Number of cubic meters of dug lagoon."""
 
-    return abs(sum(i * j for i, j in zip(x, y[1:] + y[:1])) - sum(i * j for i, j in zip(x[1:] + x[:1], y))) / 2
+        return (abs(self.double_area) + self.edges) // 2 + 1  # Pick's theorem, inside + edges
 
 
 def _parse_direction(direction: str) -> Direction:
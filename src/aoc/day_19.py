@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import asdict, dataclass, replace
 from numbers import Number
 from math import prod
@@ -8,39 +10,38 @@ from ._common import Aoc
 
 
 class Day19(Aoc):
-    def part_1(self):
+    def parse(self) -> tuple[dict[str, Workflow], list[Part]]:
         with self.open_input() as file:
             rules, parts = file.read().split("\n\n")
 
-            workflows = _parse_workflows(rules)
-            parts = _parse_parts(parts)
+        return _parse_workflows(rules), _parse_parts(parts)
+
+    def part_1(self):
+        workflows, parts = self.parsed_input
 
         return sum(part.rating for part in parts if _process_part(part, workflows))
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            rules, parts = file.read().split("\n\n")
-
-            workflows = _parse_workflows(rules)
-            part = PartRanges(*[range(1, 4001)] * 4)
-
-            to_process = [(part, "in")]
-            accepted = []
-            while to_process:
-                next_process: list[tuple[PartRanges, str]] = []
-
-                for part, label in to_process:
-                    processed = process_part_ranges(part, workflows[label])
-
-                    for proc, label_ in processed:
-                        if label_ == "A":
-                            accepted.append(proc)
-                        elif label_ == "R":
-                            pass
-                        else:
-                            next_process.append((proc, label_))
-
-                to_process = next_process
+        workflows, _ = self.parsed_input
+        part = PartRanges(*[range(1, 4001)] * 4)
+
+        to_process = [(part, "in")]
+        accepted = []
+        while to_process:
+            next_process: list[tuple[PartRanges, str]] = []
+
+            for part, label in to_process:
+                processed = process_part_ranges(part, workflows[label])
+
+                for proc, label_ in processed:
+                    if label_ == "A":
+                        accepted.append(proc)
+                    elif label_ == "R":
+                        pass
+                    else:
+                        next_process.append((proc, label_))
+
+            to_process = next_process
 
         return sum(part.rating for part in accepted)
 
@@ -1,4 +1,12 @@
+import re
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
 from enum import Enum, auto
+from functools import cached_property
+from itertools import islice
+from operator import mul
+from typing import Iterable, Self
 
 from ._common import Aoc
 
@@ -17,9 +25,16 @@ cubes_map = {
     "blue": Cube.BLUE,
 }
 
+_cubes_pattern = re.compile(r"(\d+) ([rgb])")
+
 
 def parse_game_data(game_data: str) -> list[dict[Cube, int]]:
-    """Parsed data for single game."""
+    """Parsed data for single game.
+
+    Kept as public API for callers inspecting single game subsets, solution itself reads
+    maximal counts directly into `GameIndex`.
+
+    """
 
     games = []
 
@@ -36,76 +51,100 @@ def parse_game_data(game_data: str) -> list[dict[Cube, int]]:
     return games
 
 
-def _parse_games(games_data: str) -> dict[int, list[dict[Cube, int]]]:
-    games = {}
-    for game_data in games_data.splitlines():
-        game_id_string, game_data_string = game_data.split(":")
-        game_id = game_id_string.split()[1]
-        parsed_game_data = parse_game_data(game_data_string[1:])
-        games[int(game_id)] = parsed_game_data
+class GameIndex:
+    """Maximal cube counts of games stored in compact parallel arrays.
 
-    return games
+    Games with same maximal counts are merged for limit queries and sorted by red count,
+    so only games with small enough red count are checked for each limit.
 
+    Args:
+        ids (array): Game IDs.
+        red (array): Maximal red cube counts.
+        green (array): Maximal green cube counts.
+        blue (array): Maximal blue cube counts.
 
-def maximum_cubes(game_data: list[dict[Cube, int]]) -> tuple[int, int, int]:
-    """Calculates maximum possible cubes in given game data.
+    """
 
-    Args:
-        game_data (list[dict[Cube, int]]): List of game subsets.
+    def __init__(self, ids: array, red: array, green: array, blue: array) -> None:
+        self.ids = ids
+        self.red = red
+        self.green = green
+        self.blue = blue
 
-    Returns:
-        tuple[int, int, int]: Counts of red, green and blue cubes.
+    @classmethod
+    def from_lines(cls, games_data: Iterable[str]) -> Self:
+        """Creates index from game records in single pass, without storing game subsets."""
 
-    """
-    red_count = 0
-    green_count = 0
-    blue_count = 0
+        ids, red, green, blue = array("I"), array("I"), array("I"), array("I")
 
-    for game_set in game_data:
-        if Cube.RED in game_set:
-            red_count = max([game_set[Cube.RED], red_count])
-        if Cube.GREEN in game_set:
-            green_count = max([game_set[Cube.GREEN], green_count])
-        if Cube.BLUE in game_set:
-            blue_count = max([game_set[Cube.BLUE], blue_count])
+        for game_data in games_data:
+            game_id_string, game_data_string = game_data.split(":")
+            maxima = {"r": 0, "g": 0, "b": 0}
 
-    return red_count, green_count, blue_count
+            for count_string, color in _cubes_pattern.findall(game_data_string):
+                count = int(count_string)
+                if count > maxima[color]:
+                    maxima[color] = count
 
+            ids.append(int(game_id_string.split()[1]))
+            red.append(maxima["r"])
+            green.append(maxima["g"])
+            blue.append(maxima["b"])
 
-class Day2(Aoc):
-    def part_1(self) -> int:
-        id_sum = 0
-        with self.open_input() as file:
-            content = file.read()
-            games = _parse_games(content)
+        return cls(ids, red, green, blue)
 
-            possible_cubes = {
-                Cube.RED: 12,
-                Cube.GREEN: 13,
-                Cube.BLUE: 14,
-            }
+    def power_sum(self) -> int:
+        """Sums powers of minimal cube sets of all games."""
 
-            for index, game in games.items():
-                red_count, green_count, blue_count = maximum_cubes(game)
+        return sum(map(mul, map(mul, self.red, self.green), self.blue))
 
-                if (
-                    red_count <= possible_cubes[Cube.RED]
-                    and green_count <= possible_cubes[Cube.GREEN]
-                    and blue_count <= possible_cubes[Cube.BLUE]
-                ):
-                    id_sum += index
+    def possible_games(self, red: int, green: int, blue: int) -> list[int]:
+        """Returns IDs of games possible with given cube counts."""
 
-        return id_sum
+        return [
+            game_id
+            for game_id, game_red, game_green, game_blue in zip(self.ids, self.red, self.green, self.blue)
+            if game_red <= red and game_green <= green and game_blue <= blue
+        ]
 
-    def part_2(self) -> int:
-        power_sum = 0
-        with self.open_input() as file:
-            content = file.read()
-            games = _parse_games(content)
+    def id_sums(self, limits: Iterable[tuple[int, int, int]]) -> list[int]:
+        """Sums IDs of games possible with cube counts for each of red, green and blue limits."""
 
-            for game in games.values():
-                red_count, green_count, blue_count = maximum_cubes(game)
-                power = red_count * green_count * blue_count
-                power_sum += power
+        reds, others = self._by_red
+        sums = []
 
-        return power_sum
+        for red, green, blue in limits:
+            sums.append(
+                sum(
+                    id_sum
+                    for game_green, game_blue, id_sum in islice(others, bisect_right(reds, red))
+                    if game_green <= green and game_blue <= blue
+                )
+            )
+
+        return sums
+
+    @cached_property
+    def _by_red(self) -> tuple[array, list[tuple[int, int, int]]]:
+        """Red counts and (green count, blue count, ID sum) of distinct maximal counts, sorted by red count."""
+
+        id_sums: dict[tuple[int, int, int], int] = defaultdict(int)
+        for game_id, *counts in zip(self.ids, self.red, self.green, self.blue):
+            id_sums[tuple(counts)] += game_id  # type: ignore[index]
+
+        ordered = sorted(id_sums.items())
+
+        return array("I", (red for (red, _, _), _ in ordered)), [
+            (green, blue, id_sum) for (_, green, blue), id_sum in ordered
+        ]
+
+
+class Day2(Aoc):
+    def parse(self) -> GameIndex:
+        return GameIndex.from_lines(self.iter_lines())
+
+    def part_1(self) -> int:
+        return self.parsed_input.id_sums([(12, 13, 14)])[0]
+
+    def part_2(self) -> int:
+        return self.parsed_input.power_sum()
@@ -7,60 +7,64 @@ from itertools import count
 from math import lcm
 from typing import Generator, NamedTuple, Optional
 
+from . import _metrics
 from ._common import Aoc
 
 
 class Day20(Aoc):
-    def part_1(self):
+    def parse(self) -> dict[str, tuple[str, tuple[str, ...]]]:
         with self.open_input() as file:
-            module_configuration = file.read()
+            return parse_modules(file.read())
 
-            machines = parse_configuration(module_configuration)
+    def part_1(self):
+        machines = build_machines(self.parsed_input)
 
-            pulses: list[Pulse] = []
-            for _ in range(1000):
-                signals: list[Signal] = [Signal("button", "broadcaster", Pulse.LOW)]
+        pulses: list[Pulse] = []
+        for _ in range(1000):
+            signals: list[Signal] = [Signal("button", "broadcaster", Pulse.LOW)]
 
-                while signals:
-                    signal = signals.pop(0)
-                    pulses.append(signal.pulse)
-                    new_signals = _process_signal(signal, machines)
-                    signals.extend(new_signals)
+            while signals:
+                signal = signals.pop(0)
+                pulses.append(signal.pulse)
+                new_signals = _process_signal(signal, machines)
+                signals.extend(new_signals)
 
-            counts = Counter(pulses)
+        _metrics.count("signals", len(pulses))
+        counts = Counter(pulses)
 
         return counts[Pulse.LOW] * counts[Pulse.HIGH]
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            module_configuration = file.read()
+        machines = build_machines(self.parsed_input)
 
-            machines = parse_configuration(module_configuration)
+        rx_conjunctor = [name for name, machine in machines.items() if "rx" in machine.targets][0]
+        rx_conjunctors = [name for name, machine in machines.items() if rx_conjunctor in machine.targets]
 
-            rx_conjunctor = [name for name, machine in machines.items() if "rx" in machine.targets][0]
-            rx_conjunctors = [name for name, machine in machines.items() if rx_conjunctor in machine.targets]
+        first_pulses: dict[str, Optional[int]] = {c: None for c in rx_conjunctors}
+        processed_signals = 0
+        for button_press in count(1):
+            signals: list[Signal] = [Signal("button", "broadcaster", Pulse.LOW)]
 
-            first_pulses: dict[str, Optional[int]] = {c: None for c in rx_conjunctors}
-            for button_press in count(1):
-                signals: list[Signal] = [Signal("button", "broadcaster", Pulse.LOW)]
+            while signals:
+                signal = signals.pop(0)
+                processed_signals += 1
 
-                while signals:
-                    signal = signals.pop(0)
+                new_signals = _process_signal(signal, machines)
 
-                    new_signals = _process_signal(signal, machines)
+                for new_signal in new_signals:
+                    if (
+                        new_signal.sender in rx_conjunctors
+                        and new_signal.pulse == Pulse.HIGH
+                        and not first_pulses[new_signal.sender]
+                    ):
+                        first_pulses[new_signal.sender] = button_press
 
-                    for new_signal in new_signals:
-                        if (
-                            new_signal.sender in rx_conjunctors
-                            and new_signal.pulse == Pulse.HIGH
-                            and not first_pulses[new_signal.sender]
-                        ):
-                            first_pulses[new_signal.sender] = button_press
+                signals.extend(new_signals)
 
-                    signals.extend(new_signals)
+            if all(first_pulses.values()):
+                break
 
-                if all(first_pulses.values()):
-                    break
+        _metrics.count("signals", processed_signals)
 
         return lcm(*first_pulses.values())
 
@@ -136,7 +140,16 @@ class Broadcast(Module):
 def parse_configuration(config: str) -> dict[str, Machine]:
     """Parses configuration text input into machine objects."""
 
-    modules: dict[str, Machine] = {}
+    return build_machines(parse_modules(config))
+
+
+def parse_modules(config: str) -> dict[str, tuple[str, tuple[str, ...]]]:
+    """Parses configuration text input into module types and targets.
+
+    Module type is `%` for flip-flops, `&` for conjunctions and `broadcaster` for broadcast module.
+
+    """
+    modules: dict[str, tuple[str, tuple[str, ...]]] = {}
 
     for line in config.splitlines():
         module_text, targets = line.split(" -> ")
@@ -144,16 +157,27 @@ def parse_configuration(config: str) -> dict[str, Machine]:
         targets = targets.replace(" ", "").split(",")
 
         if module_text == "broadcaster":
+            modules["broadcaster"] = ("broadcaster", tuple(targets))
+        else:
+            modules[module_text[1:]] = (module_text[0], tuple(targets))
+
+    return modules
+
+
+def build_machines(modules_data: dict[str, tuple[str, tuple[str, ...]]]) -> dict[str, Machine]:
+    """Builds machine objects in initial state from parsed modules."""
+
+    modules: dict[str, Machine] = {}
+
+    for name, (module_type, targets) in modules_data.items():
+        if module_type == "broadcaster":
             module = Broadcast()
-            name = "broadcaster"
-        elif module_text[0] == "%":
+        elif module_type == "%":
             module = FlipFlop()
-            name = module_text[1:]
         else:
             module = Conjunction()
-            name = module_text[1:]
 
-        modules[name] = Machine(module, tuple(targets))
+        modules[name] = Machine(module, targets)
 
     # Configure sources for conjunction machines
     conjunctions = {name: machine for name, machine in modules.items() if isinstance(machine.module, Conjunction)}
@@ -1,8 +1,19 @@
 import re
+from array import array
 from dataclasses import dataclass
+from mmap import mmap
+from pathlib import Path
+from typing import Generator, Iterable, NamedTuple, Optional
 
+from ._cache import AnswerCache
 from ._common import Aoc
-from .tools.coordinates import Coordinate, get_adjacent_cordinates
+from ._metrics import Metrics
+from .tools.coordinates import Coordinate
+from .tools.grid import grid_shape
+
+
+_number_pattern = re.compile(r"\d+")
+_symbol_pattern = re.compile(r"[^\w.]")
 
 
 @dataclass(frozen=True, eq=True)
@@ -23,80 +34,183 @@ class CordinateObject:
         ]
 
 
-def parse_objects(parts_map: str) -> tuple[set[CordinateObject], set[CordinateObject]]:
+class Schematic(NamedTuple):
+    """Numbers and symbols of engine schematic with map of cells covered by numbers."""
+
+    numbers: list[CordinateObject]
+    symbols: list[CordinateObject]
+    labels: array
+    """Index of number covering each buffer cell or -1 for cells without number."""
+    stride: int
+
+    def adjacent_numbers(self, symbol: CordinateObject) -> set[int]:
+        """Returns indices of numbers adjacent to symbol."""
+
+        index = symbol.start.row * self.stride + symbol.start.position
+        labels = self.labels
+        stride = self.stride
+
+        # Cells left and right of map are new lines, which are never labeled.
+        adjacent = set()
+        for offset in (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1):
+            if 0 <= index + offset < len(labels) and labels[index + offset] != -1:
+                adjacent.add(labels[index + offset])
+
+        return adjacent
+
+
+def parse_objects(parts_map: bytes | mmap) -> Schematic:
     """Parses cordinate objects (numbers and symbols) from provided map.
 
     Args:
-        parts_map (str): Multiline string providing cordinat map.
+        parts_map (bytes | mmap): Multiline buffer providing cordinat map.
 
     Returns:
-        tuple[set[CordinateObject], set[CordinateObject]]: Tuple containing sets of number na symbol cordinates.
+        Schematic: Numbers and symbols with map of cells covered by numbers.
+
+    """
+    _, _, stride = grid_shape(parts_map)
+    numbers = []
+    symbols = []
+    labels = array("i", [-1]) * len(parts_map)
+
+    for match in re.finditer(rb"(?![.\n])\W|\d+", parts_map):
+        row_index, position = divmod(match.start(), stride)
+        cordinate = CordinateObject(
+            match.group().decode(),
+            Coordinate(row_index, position),
+            match.end() - match.start(),
+        )
+        if match.group().isdigit():
+            labels[match.start() : match.end()] = array("i", [len(numbers)]) * cordinate.span
+            numbers.append(cordinate)
+        else:
+            symbols.append(cordinate)
+
+    return Schematic(numbers, symbols, labels, stride)
+
+
+class _Row(NamedTuple):
+    numbers: list[tuple[int, int, int]]
+    """Start, end and value of numbers."""
+    symbols: list[int]
+    """Positions of symbols."""
+
+
+_empty_row = _Row([], [])
+
+
+def stream_schematic(parts_map: Iterable[str]) -> Generator[tuple[list[int], list[int]], None, None]:
+    """Finds part numbers and gear ratios row by row, keeping only three rows in memory.
+
+    Objects are adjacent only to objects in previous, same and next row, so each row is evaluated
+    as soon as next row is read, and previous rows are dropped.
+
+    Args:
+        parts_map (Iterable[str]): Rows of cordinate map.
+
+    Yields:
+        tuple[list[int], list[int]]: Part numbers and gear ratios of symbols adjacent to exactly
+            two numbers, for each row.
 
     """
-    map_rows = parts_map.splitlines()
-    numbers = set()
-    symbols = set()
-
-    for row_index, map_row in enumerate(map_rows):
-        for match in re.finditer(r"(?!\.)\W|\d+", map_row):
-            cordinate = CordinateObject(
-                match.group(),
-                Coordinate(row_index, match.start()),
-                match.end() - match.start(),
-            )
-            try:
-                int(match.group())
-                numbers.add(cordinate)
-            except ValueError:
-                symbols.add(cordinate)
-
-    return numbers, symbols
+    previous, current = _empty_row, None
+
+    for line in parts_map:
+        row = _Row(
+            [(match.start(), match.end(), int(match.group())) for match in _number_pattern.finditer(line)],
+            [match.start() for match in _symbol_pattern.finditer(line)],
+        )
+
+        if current is not None:
+            yield _evaluate_row(previous, current, row)
+            previous = current
+
+        current = row
+
+    if current is not None:
+        yield _evaluate_row(previous, current, _empty_row)
+
+
+def _evaluate_row(previous: _Row, current: _Row, following: _Row) -> tuple[list[int], list[int]]:
+    window = (previous, current, following)
+    symbols = {symbol for row in window for symbol in row.symbols}
+
+    part_numbers = [value for start, end, value in current.numbers if not symbols.isdisjoint(range(start - 1, end + 1))]
+
+    gear_ratios = []
+    for symbol in current.symbols:
+        adjacent_numbers = [value for row in window for start, end, value in row.numbers if start - 1 <= symbol <= end]
+
+        if len(adjacent_numbers) == 2:
+            gear_ratios.append(adjacent_numbers[0] * adjacent_numbers[1])
+
+    return part_numbers, gear_ratios
 
 
 class Day3(Aoc):
+    """Gear ratios.
+
+    Whole schematic is indexed by default. In streaming mode, input is read row by row and both
+    parts are solved in single pass with memory proportional to row width.
+
+    Args:
+        input_file (str | Path | bytes): Challenge input text file path or input content.
+        cache (Optional[AnswerCache], optional): Persistent answer cache. Defaults to None.
+        metrics (Optional[Metrics], optional): Collector of solving metrics. Defaults to None.
+        streaming (bool, optional): Decides if input is streamed. Defaults to False.
+
+    """
+
+    def __init__(
+        self,
+        input_file: str | Path | bytes,
+        cache: Optional[AnswerCache] = None,
+        metrics: Optional[Metrics] = None,
+        streaming: bool = False,
+    ) -> None:
+        super().__init__(input_file, cache, metrics)
+        self.streaming = streaming
+
+    def parse(self) -> Schematic | tuple[int, int]:
+        if self.streaming:
+            part_numbers_sum = 0
+            ratios_sum = 0
+            for part_numbers, gear_ratios in stream_schematic(self.iter_lines()):
+                part_numbers_sum += sum(part_numbers)
+                ratios_sum += sum(gear_ratios)
+
+            return part_numbers_sum, ratios_sum
+
+        return parse_objects(self.map_input())
+
     def part_1(self) -> int:
-        with self.open_input() as file:
-            content = file.read()
-            numbers, symbols = parse_objects(content)
+        if self.streaming:
+            return self.parsed_input[0]
 
-            symbol_cordinates = set(
-                cordinates
-                for symbol in symbols
-                for cordinates in get_adjacent_cordinates(symbol.start)
-            )  # Get cordinates adjacent to symbols
+        schematic = self.parsed_input
 
-            part_numbers = set(
-                number
-                for number in numbers
-                for cordinate in number.indices
-                if cordinate in symbol_cordinates
-            )  # Select numbers adjacent to symbols
+        part_numbers = set(
+            number for symbol in schematic.symbols for number in schematic.adjacent_numbers(symbol)
+        )  # Select numbers adjacent to symbols
 
-            part_numbers_sum = sum(int(part.value) for part in part_numbers)
+        part_numbers_sum = sum(int(schematic.numbers[part].value) for part in part_numbers)
 
-            return part_numbers_sum
+        return part_numbers_sum
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            content = file.read()
-            numbers, symbols = parse_objects(content)
+        if self.streaming:
+            return self.parsed_input[1]
 
-            ratios_sum = 0
-            for symbol in symbols:
-                adjacent_symbols = get_adjacent_cordinates(symbol.start)
-
-                adjacent_numbers = set(
-                    number
-                    for number in numbers
-                    for indice in number.indices
-                    if indice in adjacent_symbols
-                )  # Find all numbers adjacent to symbol
-
-                if len(adjacent_numbers) == 2:
-                    adjacent_numbers_list = list(adjacent_numbers)
-                    gear_ratio = int(adjacent_numbers_list[0].value) * int(
-                        adjacent_numbers_list[1].value
-                    )
-                    ratios_sum += gear_ratio
-
-            return ratios_sum
+        schematic = self.parsed_input
+
+        ratios_sum = 0
+        for symbol in schematic.symbols:
+            adjacent_numbers = schematic.adjacent_numbers(symbol)
+
+            if len(adjacent_numbers) == 2:
+                first, second = adjacent_numbers
+                gear_ratio = int(schematic.numbers[first].value) * int(schematic.numbers[second].value)
+                ratios_sum += gear_ratio
+
+        return ratios_sum
@@ -1,56 +1,90 @@
 import re
+from typing import Iterable
 
 from ._common import Aoc
 
 
 class Day4(Aoc):
+    def parse(self) -> tuple[int, int]:
+        return score_cards(map(match_count, self.iter_lines()))
+
     def part_1(self) -> int:
-        with self.open_input() as file:
-            content = file.read()
+        points_sum, _ = self.parsed_input
 
-            points_sum = 0
+        return points_sum
 
-            for card in content.splitlines():
-                _, winning_numbers, guessed_numbers = parse_card(card)
+    def part_2(self) -> int:
+        _, total_cards = self.parsed_input
 
-                winning_set = set(winning_numbers)
-                guessed_set = set(guessed_numbers)
+        return total_cards
 
-                correct_numbers = winning_set & guessed_set
-                correct_count = len(correct_numbers)
 
-                if correct_count:
-                    card_value = 2 ** (correct_count - 1)
-                    points_sum += card_value
+def match_count(card_data: str) -> int:
+    """Counts guessed numbers which are winning.
 
-            return points_sum
+    Numbers are encoded as bits of integer masks, so matches are counted by single `&` and popcount.
 
-    def part_2(self) -> int:
-        with self.open_input() as file:
-            content = file.read()
+    Args:
+        card_data (str): String representing card data.
+
+    Returns:
+        int: Number of matches.
+
+    """
+    _, numbers_string = card_data.split(":")
+    winning_string, guessed_string = numbers_string.split("|")
+
+    return (_encode_numbers(winning_string) & _encode_numbers(guessed_string)).bit_count()
+
+
+def score_cards(match_counts: Iterable[int]) -> tuple[int, int]:
+    """Calculates points and total number of cards won in single pass over cards.
+
+    Won copies are propagated by difference array, so each card adds copies to following cards
+    by two updates regardless of its match count. Difference array is ring buffer covering only
+    cards reachable from current card, so memory is bounded by maximal match count and match
+    counts can be streamed.
+
+    Args:
+        match_counts (Iterable[int]): Match counts of cards ordered by card id.
+
+    Returns:
+        tuple[int, int]: Sum of card points and total number of cards.
+
+    """
+    points_sum = 0
+    total_cards = 0
+    won_copies = 0
+    copies_diff = [0] * 16
+
+    for card_index, correct_count in enumerate(match_counts):
+        if correct_count + 2 > len(copies_diff):
+            copies_diff = _resize_ring(copies_diff, card_index, 2 * (correct_count + 2))
 
-            card_copies = {}
+        size = len(copies_diff)
+        slot = card_index % size
 
-            for card in content.splitlines():
-                card_id, winning_numbers, guessed_numbers = parse_card(card)
+        won_copies += copies_diff[slot]
+        copies_diff[slot] = 0
+        copies = won_copies + 1
+        total_cards += copies
 
-                _increment_card_count(card_copies, card_id)
+        if correct_count:
+            points_sum += 1 << (correct_count - 1)
+            copies_diff[(card_index + 1) % size] += copies
+            copies_diff[(card_index + correct_count + 1) % size] -= copies
 
-                winning_set = set(winning_numbers)
-                guessed_set = set(guessed_numbers)
+    return points_sum, total_cards
 
-                correct_numbers = winning_set & guessed_set
 
-                for cards in range(len(correct_numbers)):
-                    card_to_update = card_id + cards + 1
-                    current_card_value = card_copies[card_id]
-                    _increment_card_count(
-                        card_copies, card_to_update, current_card_value
-                    )
+def _resize_ring(ring: list[int], start: int, size: int) -> list[int]:
+    """Copies ring buffer into larger one, keeping items at their offsets from `start`."""
 
-            total_cards = sum(card_copies.values())
+    resized = [0] * size
+    for offset in range(len(ring)):
+        resized[(start + offset) % size] = ring[(start + offset) % len(ring)]
 
-            return total_cards
+    return resized
 
 
 def parse_card(card_data: str) -> tuple[int, list[int], list[int]]:
@@ -72,11 +106,12 @@ def parse_card(card_data: str) -> tuple[int, list[int], list[int]]:
     return int(card_id), winning_numbers, guessed_numbers
 
 
-def _increment_card_count(cards_counter: dict[int, int], card_id: int, count: int = 1):
-    if card_id not in cards_counter:
-        cards_counter[card_id] = 0
+def _encode_numbers(numbers_string: str) -> int:
+    mask = 0
+    for number in numbers_string.split():
+        mask |= 1 << int(number)
 
-    cards_counter[card_id] = cards_counter[card_id] + count
+    return mask
 
 
 def _unpack_numbers(numbers_string: str) -> list[int]:
@@ -1,9 +1,13 @@
 import re
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from functools import partial
+from functools import partial, reduce
 from itertools import islice
-from typing import Iterable
+from math import inf
+from typing import Iterable, Self
 
+from . import _metrics
 from ._common import Aoc
 
 
@@ -13,17 +17,93 @@ class Map:
     target: range
 
 
-def find_locations(seeds: Iterable[int], mappings: list[list[Map]]) -> list[int]:
-    locations: list[int] = []
+class PiecewiseMap:
+    """Mapping of non-negative integers shifting every interval between breakpoints by its offset.
+
+    Value `x` in `[starts[i], starts[i + 1])` is mapped to `x + offsets[i]`, last interval is unbounded.
+
+    Args:
+        starts (list[int]): Sorted interval starts, first one is 0.
+        offsets (list[int]): Interval offsets.
+
+    """
+
+    def __init__(self, starts: list[int], offsets: list[int]) -> None:
+        self.starts = starts
+        self.offsets = offsets
+
+    @classmethod
+    def from_maps(cls, maps: Iterable[Map]) -> Self:
+        """Creates piecewise map from almanac maps, values outside of maps are not shifted."""
+
+        starts, offsets = [0], [0]
+        for mapping in sorted(maps, key=lambda mapping: mapping.source.start):
+            if mapping.source.start == starts[-1]:
+                offsets[-1] = mapping.target.start - mapping.source.start
+            else:
+                starts.append(mapping.source.start)
+                offsets.append(mapping.target.start - mapping.source.start)
+
+            starts.append(mapping.source.stop)
+            offsets.append(0)
+
+        return cls(starts, offsets)._merged()
+
+    def __call__(self, value: int) -> int:
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """Composes map with map applied after it."""
+
+        starts, offsets = [], []
+        for index, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            stop = self.starts[index + 1] if index + 1 < len(self.starts) else inf
+
+            # Splits image of interval by breakpoints of following map.
+            other_index = bisect_right(other.starts, start + offset) - 1
+            while other_index < len(other.starts) and other.starts[other_index] < stop + offset:
+                starts.append(max(other.starts[other_index] - offset, start))
+                offsets.append(offset + other.offsets[other_index])
+                other_index += 1
+
+        return PiecewiseMap(starts, offsets)._merged()
+
+    def map_many(self, values: Iterable[int]) -> array:
+        """Maps batch of values into compact array.
+
+        Args:
+            values (Iterable[int]): Non-negative values.
+
+        Returns:
+            array: Mapped values in input order.
+
+        """
+        starts, offsets = self.starts, self.offsets
+
+        return array("q", [value + offsets[bisect_right(starts, value) - 1] for value in values])
+
+    def _merged(self) -> Self:
+        """Merges neighbouring intervals with same offset."""
+
+        starts, offsets = [self.starts[0]], [self.offsets[0]]
+        for start, offset in zip(self.starts[1:], self.offsets[1:]):
+            if offset != offsets[-1]:
+                starts.append(start)
+                offsets.append(offset)
 
-    for seed_id in seeds:
-        value = seed_id
-        for mapping in mappings:
-            value = find_in_map(mapping, value)
+        self.starts, self.offsets = starts, offsets
 
-        locations.append(value)
+        return self
 
-    return locations
+
+def compose_mappings(mappings: list[list[Map]]) -> PiecewiseMap:
+    """Composes all almanac stages into single piecewise map."""
+
+    return reduce(PiecewiseMap.then, map(PiecewiseMap.from_maps, mappings))
+
+
+def find_locations(seeds: Iterable[int], mappings: list[list[Map]]) -> list[int]:
+    return list(compose_mappings(mappings).map_many(seeds))
 
 
 def find_in_map(maps: list[Map], source_value: int) -> int:
@@ -60,108 +140,98 @@ def parse_mappings(sections: list[str]) -> dict[str, list[Map]]:
     return mappings_dict
 
 
-def convert_range(input_range: range, mappings: list[Map]) -> list[range]:
-    """Converts single range according to mappings.
+def convert_intervals(intervals: Iterable[tuple[int, int]], stage: PiecewiseMap) -> list[tuple[int, int]]:
+    """Converts intervals through almanac stage.
+
+    Intervals are split at stage breakpoints, every part is shifted by offset of its stage interval.
 
     Args:
-        input_range (range): Input range of data.
-        mappings (list[Map]): Conversions mappings.
+        intervals (Iterable[tuple[int, int]]): Half-open intervals of values.
+        stage (PiecewiseMap): Almanac stage.
 
     Returns:
-        list[range]: Converted values.
+        list[tuple[int, int]]: Sorted converted intervals, coalesced.
 
     """
-    converted_ranges = []
-    unconverted_ranges = [input_range]
-
-    for mapping in mappings:
-        new_unconverted_ranges = []
-
-        for unconverted_range in unconverted_ranges:
-            new_unconverted_ranges.clear()
-            intersection = range(
-                max(unconverted_range.start, mapping.source.start),
-                min(unconverted_range.stop, mapping.source.stop),
-            )
-            if len(intersection) != 0:
-                low_index = unconverted_range.index(intersection.start)
-
-                if low_index > 0:
-                    new_unconverted_ranges.append(
-                        range(unconverted_range.start, unconverted_range[low_index])
-                    )
-
-                high_index = unconverted_range.index(intersection.stop - 1)
-
-                if high_index < len(unconverted_range) - 1:
-                    new_unconverted_ranges.append(
-                        range(unconverted_range[high_index], unconverted_range.stop)
-                    )
-
-                source_start = mapping.source.index(intersection.start)
-                source_stop = mapping.source.index(intersection.stop - 1)
-
-                converted_ranges.append(
-                    range(
-                        mapping.target[source_start],
-                        mapping.target[source_stop] + 1,
-                    )
-                )
-            else:
-                new_unconverted_ranges = [unconverted_range]
+    starts, offsets = stage.starts, stage.offsets
+    converted = []
 
-        unconverted_ranges = new_unconverted_ranges
+    for start, stop in intervals:
+        index = bisect_right(starts, start) - 1
 
-    return converted_ranges + unconverted_ranges
+        while start < stop:
+            part_stop = min(stop, starts[index + 1]) if index + 1 < len(starts) else stop
+            converted.append((start + offsets[index], part_stop + offsets[index]))
+            start = part_stop
+            index += 1
 
+    return coalesce_intervals(converted)
 
-def parse_seed_ranges(seed_ranges: list[range], mapping_list: list[list[Map]]):
-    parsed_ranges = seed_ranges
 
-    for mappings in mapping_list:
-        converted_ranges = []
-        for seed_range in parsed_ranges:
-            converted_range = convert_range(seed_range, mappings)
-            converted_ranges.extend(converted_range)
+def coalesce_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sorts half-open intervals and merges overlapping and adjacent ones."""
 
-        parsed_ranges = converted_ranges
+    coalesced: list[tuple[int, int]] = []
+    for start, stop in sorted(intervals):
+        if coalesced and start <= coalesced[-1][1]:
+            if stop > coalesced[-1][1]:
+                coalesced[-1] = (coalesced[-1][0], stop)
+        else:
+            coalesced.append((start, stop))
 
-    return parsed_ranges
+    return coalesced
 
 
-class Day5(Aoc):
-    def part_1(self) -> int:
-        with self.open_input() as file:
-            content = file.read()
+def convert_seed_intervals(
+    seed_intervals: Iterable[tuple[int, int]], mappings: list[list[Map]]
+) -> list[tuple[int, int]]:
+    """Converts seed intervals through all almanac stages.
+
+    Intervals are coalesced after every stage, so number of fragments stays bounded. Fragment
+    count after every stage is reported as `stage_<N>_fragments` metrics counter.
 
-            groups = content.split("\n\n")
+    Args:
+        seed_intervals (Iterable[tuple[int, int]]): Half-open intervals of seeds.
+        mappings (list[list[Map]]): Almanac stages.
+
+    Returns:
+        list[tuple[int, int]]: Sorted location intervals.
 
-            seeds_ids = [int(seed) for seed in groups[0][7:].split()]
-            mappings_dict = parse_mappings(groups[1:])
+    """
+    intervals = coalesce_intervals(seed_intervals)
 
-            locations = find_locations(seeds_ids, list(mappings_dict.values()))
+    for index, mapping in enumerate(mappings, 1):
+        intervals = convert_intervals(intervals, PiecewiseMap.from_maps(mapping))
+        _metrics.count(f"stage_{index}_fragments", len(intervals))
 
-            return min(locations)
+    return intervals
 
-    def part_2(self) -> int:
+
+class Day5(Aoc):
+    def parse(self) -> tuple[list[int], list[list[Map]]]:
         with self.open_input() as file:
-            content = file.read()
+            groups = file.read().split("\n\n")
+
+        seeds = [int(seed) for seed in groups[0][7:].split()]
+        mappings_dict = parse_mappings(groups[1:])
+
+        return seeds, list(mappings_dict.values())
 
-            groups = content.split("\n\n")
+    def part_1(self) -> int:
+        seeds_ids, mappings = self.parsed_input
+
+        locations = find_locations(seeds_ids, mappings)
 
-            seeds_id_ranges = [int(seed) for seed in groups[0][7:].split()]
-            mappings_dict = parse_mappings(groups[1:])
+        return min(locations)
 
-            seed_groups = iter(
-                partial(lambda it: tuple(islice(it, 2)), iter(seeds_id_ranges)), ()
-            )  # Splits list into 2 value sublists.
-            seed_ranges = [
-                range(seed_group[0], seed_group[0] + seed_group[1])
-                for seed_group in seed_groups
-            ]
+    def part_2(self) -> int:
+        seeds_id_ranges, mappings = self.parsed_input
 
-            parsed_ranges = parse_seed_ranges(seed_ranges, list(mappings_dict.values()))
+        seed_groups = iter(
+            partial(lambda it: tuple(islice(it, 2)), iter(seeds_id_ranges)), ()
+        )  # Splits list into 2 value sublists.
+        seed_intervals = [(seed_group[0], seed_group[0] + seed_group[1]) for seed_group in seed_groups]
 
-            location = min(location_range.start for location_range in parsed_ranges)
+        location_intervals = convert_seed_intervals(seed_intervals, mappings)
 
-            return location
+        return location_intervals[0][0]
@@ -1,34 +1,34 @@
+from math import isqrt, prod
+from typing import Iterable, Optional
+
 from ._common import Aoc
 
 
 class Day6(Aoc):
-    def part_1(self) -> int:
+    def parse(self) -> tuple[list[str], list[str]]:
         with self.open_input() as file:
             content = file.read().splitlines()
 
-            times = [int(value) for value in content[0].split()[1:]]
-            distances = [int(value) for value in content[1].split()[1:]]
+        return content[0].split()[1:], content[1].split()[1:]
 
-            races = zip(times, distances)
+    def part_1(self) -> int:
+        times_data, distances_data = self.parsed_input
 
-            error_margin = 1
+        times = [int(value) for value in times_data]
+        distances = [int(value) for value in distances_data]
 
-            for race in races:
-                solutions = find_solutions(*race)
-                error_margin *= len(solutions)
+        races = zip(times, distances)
+        error_margin = prod(count_solutions_many(races))
 
-            return error_margin
+        return error_margin
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            content = file.read().splitlines()
+        times_data, distances_data = self.parsed_input
 
-            time = int("".join(content[0].split()[1:]))
-            distance = int("".join(content[1].split()[1:]))
+        time = int("".join(times_data))
+        distance = int("".join(distances_data))
 
-            solutions = find_solutions(time, distance)
-
-            return len(solutions)
+        return count_solutions(time, distance)
 
 
 def find_solutions(time: int, distance: int) -> list[int]:
@@ -42,4 +42,62 @@ def find_solutions(time: int, distance: int) -> list[int]:
         list[int]: List of button hold times [ms].
 
     """
-    return [hold for hold in range(time) if hold * (time - hold) > distance]
+    return list(iter_solutions(time, distance))
+
+
+def iter_solutions(time: int, distance: int) -> range:
+    """Lazily generates button hold times [ms] winning race, see `find_solutions`."""
+
+    first_hold = _first_winning_hold(time, distance)
+    if first_hold is None:
+        return range(0)
+
+    return range(first_hold, time - first_hold + 1)
+
+
+def count_solutions(time: int, distance: int) -> int:
+    """Counts solutions how to win race without generating them.
+
+    Args:
+        time (int): Total race time [ms].
+        distance (int): Top distance [mm].
+
+    Returns:
+        int: Number of winning button hold times.
+
+    """
+    first_hold = _first_winning_hold(time, distance)
+    if first_hold is None:
+        return 0
+
+    return time - 2 * first_hold + 1  # Winning holds are symmetric around half of race time.
+
+
+def count_solutions_many(races: Iterable[tuple[int, int]]) -> list[int]:
+    """Counts solutions of many races given as time and distance pairs."""
+
+    return [count_solutions(time, distance) for time, distance in races]
+
+
+def _first_winning_hold(time: int, distance: int) -> Optional[int]:
+    """Finds shortest winning hold, which is smaller root of `hold * (time - hold) = distance` rounded up.
+
+    Root is calculated by exact integer square root, so it's precise also for huge values.
+
+    """
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0:
+        return None
+
+    hold = max((time - isqrt(discriminant)) // 2, 0)
+
+    # Integer square root is rounded down, so hold is at most one step off.
+    while hold * (time - hold) <= distance:
+        hold += 1
+        if 2 * hold > time:
+            return None
+
+    while hold > 0 and (hold - 1) * (time - hold + 1) > distance:
+        hold -= 1
+
+    return hold
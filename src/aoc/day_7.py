@@ -1,8 +1,7 @@
 from collections import Counter
-from dataclasses import dataclass
 from enum import Enum, IntEnum
 from operator import itemgetter
-from typing import cast, Iterable, Self
+from typing import cast, Generator, Iterable, Optional, Self
 
 from ._common import Aoc
 
@@ -41,97 +40,96 @@ class HandType(Enum):
     HIGH_CARD = 0
 
 
-@dataclass
 class Hand:
-    """Represents hand of cards."""
+    """Represents hand of cards.
 
-    cards: TypeHand
+    Hand is classified once on creation into packed integer sort key, so comparisons are plain
+    integer comparisons.
 
-    def __eq__(self, other: Self):
-        if self.hand_type.value == other.hand_type.value:
-            for index, card in enumerate(self.cards):
-                if other.cards[index].value != card.value:
-                    return False
+    """
 
-            return True
+    __slots__ = ("cards", "hand_type", "key")
 
-        return False
+    def __init__(self, cards: TypeHand) -> None:
+        self.cards = cards
+        self.hand_type = classify_hand(cards)
+        self.key = hand_key(cards, self.hand_type)
 
-    def __lt__(self, other: Self):
-        if self.hand_type.value == other.hand_type.value:
-            for index, card in enumerate(self.cards):
-                card_value = card.value
-                other_value = other.cards[index].value
-                if card_value != other_value:
-                    return card_value < other_value
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Hand) and self.key == other.key
 
-            return False
+    def __hash__(self) -> int:
+        return hash(self.key)
 
-        return self.hand_type.value < other.hand_type.value
+    def __lt__(self, other: Self) -> bool:
+        return self.key < other.key
 
     def __repr__(self) -> str:
         return "".join(repr(self.cards))
 
-    @property
-    def hand_type(self) -> HandType:
-        """Type of hand."""
-        cards = self.cards
-        if Card.JOKER in self.cards:
-            cards = replace_jokers(cards)
 
-        hand_type = find_hand_type(cards)
+class Day7(Aoc):
+    def parse(self) -> list[tuple[int, int, int]]:
+        hands_data = []
+        for line in self.iter_lines():
+            cards_string, bid = line.split()
+            hand = Hand(_parse_cards(cards_string))
+            joker_hand = Hand(_parse_cards(cards_string, jokers=True))
 
-        return hand_type
+            hands_data.append((hand.key, joker_hand.key, int(bid)))
 
+        return hands_data
 
-class Day7(Aoc):
     def part_1(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
+        return _total_winnings((key, bid) for key, _, bid in self.parsed_input)
 
-            hands = []
+    def part_2(self) -> int:
+        return _total_winnings((joker_key, bid) for _, joker_key, bid in self.parsed_input)
 
-            for line in lines:
-                cards_string, bid = line.split()
 
-                cards = _parse_cards(cards_string)
-                cards = cast(TypeHand, cards)
-                hand = Hand(cards)
-                hands.append((int(bid), hand))
+def hand_key(cards: Iterable[Card], hand_type: HandType) -> int:
+    """Packs hand into integer ordering hands by type and then by cards.
 
-            sorted_hands = sorted(hands, key=itemgetter(1))
+    Type is stored in high bits, followed by cards values in 4 bit nibbles.
 
-            winning_sum = 0
+    Args:
+        cards (Iterable[Card]): Cards in hand.
+        hand_type (HandType): Type of hand.
 
-            for index, sorted_hand in enumerate(sorted_hands):
-                hand_win = (index + 1) * sorted_hand[0]
-                winning_sum += hand_win
+    Returns:
+        int: Sort key of hand.
 
-        return winning_sum
+    """
+    key = hand_type.value
+    for card in cards:
+        key = key << 4 | card
 
-    def part_2(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
+    return key
 
-            hands = []
 
-            for line in lines:
-                cards_string, bid = line.split()
+def classify_hand(cards: TypeHand) -> HandType:
+    """Finds type of hand, jokers count as cards providing highest hand type.
 
-                cards = _parse_cards(cards_string, jokers=True)
-                cards = cast(TypeHand, cards)
-                hand = Hand(cards)
-                hands.append((int(bid), hand))
+    Multiplicities of cards are identified by sum of their squares, which is unique for every
+    multiplicity signature of up to five cards, so type is looked up without any joker substitution.
 
-            sorted_hands = sorted(hands, key=itemgetter(1))
+    Args:
+        cards (TypeHand): Cards in hand.
 
-            winning_sum = 0
+    Raises:
+        ValueError: In case of hand without five cards.
 
-            for index, sorted_hand in enumerate(sorted_hands):
-                hand_win = (index + 1) * sorted_hand[0]
-                winning_sum += hand_win
+    Returns:
+        HandType: Type of hand.
+
+    """
+    jokers = cards.count(Card.JOKER)
+    hand_type = _hand_types[jokers][sum(map(cards.count, cards)) - jokers * jokers] if len(cards) == 5 else None
 
-        return winning_sum
+    if hand_type is None:
+        raise ValueError("Unparsable Hand")
+
+    return hand_type
 
 
 def parse_card(card: str, jokers: bool = False) -> Card:
@@ -256,5 +254,66 @@ def replace_jokers(cards: Iterable[Card]) -> tuple[Card, ...]:
         return (Card.ACE, Card.ACE, Card.ACE, Card.ACE, Card.ACE)
 
 
-def _parse_cards(cards: str, jokers: bool = False) -> tuple[Card, ...]:
-    return tuple(parse_card(card, jokers) for card in [*cards])
+_signature_hand_types = {
+    (5,): HandType.POKER,
+    (4, 1): HandType.FOUR,
+    (3, 2): HandType.FULL_HOUSE,
+    (3, 1, 1): HandType.THREE,
+    (2, 2, 1): HandType.TWO_PAIR,
+    (2, 1, 1, 1): HandType.PAIR,
+    (1, 1, 1, 1, 1): HandType.HIGH_CARD,
+}
+
+
+def _iter_signatures(cards: int, largest: int = 5) -> Generator[tuple[int, ...], None, None]:
+    """Yields descending multiplicity signatures of given number of cards."""
+
+    if not cards:
+        yield ()
+        return
+
+    for multiplicity in range(min(cards, largest), 0, -1):
+        for rest in _iter_signatures(cards - multiplicity, multiplicity):
+            yield (multiplicity, *rest)
+
+
+def _build_hand_types() -> list[list[Optional[HandType]]]:
+    """Builds table of hand types indexed by joker count and sum of squared multiplicities of other cards.
+
+    Jokers always join the most frequent other card.
+
+    """
+    hand_types: list[list[Optional[HandType]]] = [[None] * 26 for _ in range(6)]
+
+    for jokers in range(6):
+        for signature in _iter_signatures(5 - jokers):
+            best_signature = (signature[0] + jokers, *signature[1:]) if signature else (jokers,)
+            square_sum = sum(multiplicity * multiplicity for multiplicity in signature)
+            hand_types[jokers][square_sum] = _signature_hand_types[best_signature]
+
+    return hand_types
+
+
+_hand_types = _build_hand_types()
+_cards_by_symbol = {symbol: parse_card(symbol) for symbol in "23456789TJQKA"}
+_joker_cards_by_symbol = {**_cards_by_symbol, "J": Card.JOKER}
+
+
+def _parse_cards(cards: str, jokers: bool = False) -> TypeHand:
+    cards_by_symbol = _joker_cards_by_symbol if jokers else _cards_by_symbol
+
+    return cast(TypeHand, tuple(cards_by_symbol[card] for card in cards))
+
+
+def _total_winnings(hands: Iterable[tuple[int, int]]) -> int:
+    """Sums bids multiplied by ranks of hands given by their sort keys."""
+
+    sorted_hands = sorted(hands, key=itemgetter(0))
+
+    winning_sum = 0
+
+    for index, (_, bid) in enumerate(sorted_hands):
+        hand_win = (index + 1) * bid
+        winning_sum += hand_win
+
+    return winning_sum
@@ -5,28 +5,28 @@ from ._common import Aoc
 
 
 class Day8(Aoc):
-    def part_1(self) -> int:
+    def parse(self) -> tuple[str, dict[str, tuple[str, str]]]:
         with self.open_input() as file:
-            lines = file.read().splitlines()
-            instructions, nodes = _parse_inputs(lines)
+            return _parse_inputs(file.read().splitlines())
+
+    def part_1(self) -> int:
+        instructions, nodes = self.parsed_input
 
-            counter = calculate_steps(nodes, instructions, "AAA", "ZZZ")
+        counter = calculate_steps(nodes, instructions, "AAA", "ZZZ")
 
         return counter
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
-            instructions, nodes = _parse_inputs(lines)
+        instructions, nodes = self.parsed_input
 
-            ghosts = [node[:2] for node in nodes if node[2] == "A"]
+        ghosts = [node[:2] for node in nodes if node[2] == "A"]
 
-            ghosts_steps = [
-                calculate_steps(nodes, instructions, ghost + "A", "Z")
-                for ghost in ghosts
-            ]
+        ghosts_steps = [
+            calculate_steps(nodes, instructions, ghost + "A", "Z")
+            for ghost in ghosts
+        ]
 
-            common_steps = lcm(*ghosts_steps)
+        common_steps = lcm(*ghosts_steps)
 
         return common_steps
 
@@ -1,56 +1,41 @@
+from typing import Iterable, Iterator
+
 from ._common import Aoc
 
 
 class Day9(Aoc):
-    def part_1(self):
-        with self.open_input() as file:
-            lines = file.read().splitlines()
-
-            history_sets = []
-            for line in lines:
-                history_sets.append([int(value) for value in line.split()])
-
-            interpolated_sum = 0
-
-            for dataset in history_sets:
-                diffs = [[*dataset]]
-                while not all(diff == 0 for diff in diffs[-1]):
-                    diffs.append(generate_diffs(diffs[-1]))
+    def parse(self) -> None:
+        """Histories are streamed by each part, so whole input is never loaded."""
 
-                vals = [0]
-                last_diffs = list(diff[-1] for diff in diffs)[:-1]
-                last_diffs.reverse()
-                for value in last_diffs:
-                    vals.append(vals[-1] + value)
+        return None
 
-                interpolated_sum += vals[-1]
-
-        return interpolated_sum
+    def part_1(self) -> int:
+        return sum(extrapolate(history)[0] for history in _parse_histories(self.iter_lines()))
 
     def part_2(self) -> int:
-        with self.open_input() as file:
-            lines = file.read().splitlines()
+        return sum(extrapolate(history)[1] for history in _parse_histories(self.iter_lines()))
+
 
-            history_sets = []
-            for line in lines:
-                history_sets.append([int(value) for value in line.split()])
+def extrapolate(history: list[int]) -> tuple[int, int]:
+    """Extrapolates next and previous value of history from single pyramid of differences.
 
-            interpolated_sum = 0
+    Args:
+        history (list[int]): History values.
 
-            for dataset in history_sets:
-                diffs = [[*dataset]]
-                while not all(diff == 0 for diff in diffs[-1]):
-                    diffs.append(generate_diffs(diffs[-1]))
+    Returns:
+        tuple[int, int]: Next and previous value.
 
-                vals = [0]
-                first_diffs = list(diff[0] for diff in diffs)[:-1]
-                first_diffs.reverse()
-                for value in first_diffs:
-                    vals.append(value - vals[-1])
+    """
+    diffs = [history]
+    while not all(diff == 0 for diff in diffs[-1]):
+        diffs.append(generate_diffs(diffs[-1]))
 
-                interpolated_sum += vals[-1]
+    next_value = previous_value = 0
+    for diff in reversed(diffs[:-1]):
+        next_value = diff[-1] + next_value
+        previous_value = diff[0] - previous_value
 
-        return interpolated_sum
+    return next_value, previous_value
 
 
 def generate_diffs(data: list[int]) -> list[int]:
@@ -60,3 +45,8 @@ def generate_diffs(data: list[int]) -> list[int]:
         diffs.append(diff)
 
     return diffs
+
+
+def _parse_histories(lines: Iterable[str]) -> Iterator[list[int]]:
+    for line in lines:
+        yield [int(value) for value in line.split()]
@@ -1,37 +1,39 @@
 """Helpers for coordinate based tasks."""
 
-from dataclasses import dataclass
 from enum import Enum
-from functools import singledispatchmethod
-from typing import Self
+from typing import Generator, Iterable, NamedTuple, Self
 
+_new_tuple = tuple.__new__
 
-@dataclass(frozen=True)
-class Coordinate:
-    """Single coordinate."""
+
+class Coordinate(NamedTuple):
+    """Single coordinate.
+
+    Coordinates are tuples, so they are hashed and compared in C. Arithmetic creates results
+    directly by `tuple.__new__`, skipping Python level constructor.
+
+    """
 
     row: int
     position: int
 
-    def __add__(self, other: Self) -> Self:
-        return Coordinate(self.row + other.row, self.position + other.position)
+    def __add__(self, other: Self) -> Self:  # type: ignore[override]
+        return _new_tuple(Coordinate, (self[0] + other[0], self[1] + other[1]))
 
-    def __eq__(self, other: Self) -> bool:
-        return self.row == other.row and self.position == other.position
+    def __mul__(self, other: int) -> Self:  # type: ignore[override]
+        if not isinstance(other, int):
+            raise TypeError("Not supported.")
 
-    @singledispatchmethod
-    def __mul__(self, other) -> Self:
-        raise TypeError("Not supported.")
+        return _new_tuple(Coordinate, (self[0] * other, self[1] * other))
 
-    @__mul__.register
-    def _(self, other: int) -> Self:
-        return Coordinate(self.row * other, self.position * other)
+    # Scales coordinate instead of inherited tuple repetition.
+    __rmul__ = __mul__
 
     def __repr__(self):
-        return f"({self.row}, {self.position})"
+        return f"({self[0]}, {self[1]})"
 
     def __sub__(self, other: Self) -> Self:
-        return Coordinate(self.row - other.row, self.position - other.position)
+        return _new_tuple(Coordinate, (self[0] - other[0], self[1] - other[1]))
 
 
 class Direction(Enum):
@@ -42,6 +44,13 @@ class Direction(Enum):
     LEFT = Coordinate(0, -1)
     RIGHT = Coordinate(0, 1)
 
+    def __init__(self, *_: int) -> None:
+        # Same as `value`, but read as plain attribute without overhead of enum property.
+        self.delta: Coordinate = self.value
+
+    # Members are singletons, identity hash is computed in C unlike default enum hash.
+    __hash__ = object.__hash__
+
     def __repr__(self):
         match self:
             case Direction.UP:
@@ -54,29 +63,73 @@ class Direction(Enum):
                 return "→"
 
     @property
-    def opposite(self) -> Self:
-        return Direction(self.value * -1)
+    def opposite(self) -> "Direction":
+        return opposite_directions[self]
 
     def is_horizontal(self) -> bool:
-        return self in {self.LEFT, self.RIGHT}
+        return self in horizontal_directions
 
     def is_vertical(self) -> bool:
-        return not self.is_horizontal()
+        return self not in horizontal_directions
 
-    def rotate(self, clockwise: bool = True):
+    def rotate(self, clockwise: bool = True) -> "Direction":
         if clockwise:
-            return Direction(Coordinate(self.value.position, self.value.row * -1))
+            return clockwise_rotations[self]
+
+        return counterclockwise_rotations[self]
+
+
+clockwise_rotations = {
+    direction: Direction(Coordinate(direction.delta.position, -direction.delta.row)) for direction in Direction
+}
+"""Directions rotated clockwise by direction."""
+
+counterclockwise_rotations = {rotated: direction for direction, rotated in clockwise_rotations.items()}
+"""Directions rotated counterclockwise by direction."""
+
+opposite_directions = {direction: Direction(direction.delta * -1) for direction in Direction}
+"""Opposite directions by direction."""
+
+horizontal_directions = frozenset((Direction.LEFT, Direction.RIGHT))
 
-        return Direction(Coordinate(self.value.position * -1, self.value.row))
+direction_deltas = tuple(direction.delta for direction in Direction)
+"""Coordinate diffs of directions in `Direction` order."""
+
+delta_directions = {direction.delta: direction for direction in Direction}
+"""Directions by their coordinate diffs."""
+
+adjacent_offsets = direction_deltas
+"""Coordinate diffs of horizontally and vertically adjacent coordinates."""
+
+diagonal_adjacent_offsets = tuple(
+    Coordinate(row, position) for row in (-1, 0, 1) for position in (-1, 0, 1) if row != 0 or position != 0
+)
+"""Coordinate diffs of all adjacent coordinates, including diagonal ones."""
 
 
 def get_adjacent_cordinates(coordinate: Coordinate, diagonal: bool = True) -> set[Coordinate]:
     """Returns coordinates adjacent to specified coordinate."""
 
-    return set(
-        Coordinate(coordinate.row + row, coordinate.position + position)
-        for row in (-1, 0, 1)
-        for position in (-1, 0, 1)
-        if (row != 0 or position != 0)
-        and ((row != position and abs(row - position) != 2) if not diagonal else True)
-    )
+    return {coordinate + offset for offset in (diagonal_adjacent_offsets if diagonal else adjacent_offsets)}
+
+
+def iter_adjacent_cordinates(
+    coordinates: Iterable[Coordinate], diagonal: bool = True
+) -> Generator[tuple[Coordinate, Coordinate], None, None]:
+    """Yields coordinates adjacent to all specified coordinates.
+
+    Args:
+        coordinates (Iterable[Coordinate]): Coordinates whose neighbours are yielded.
+        diagonal (bool, optional): Decides if diagonally adjacent coordinates are yielded. Defaults to True.
+
+    Yields:
+        tuple[Coordinate, Coordinate]: Coordinate and its adjacent coordinate.
+
+    """
+    offsets = diagonal_adjacent_offsets if diagonal else adjacent_offsets
+
+    for row, position in coordinates:
+        coordinate = _new_tuple(Coordinate, (row, position))
+
+        for offset_row, offset_position in offsets:
+            yield coordinate, _new_tuple(Coordinate, (row + offset_row, position + offset_position))
@@ -0,0 +1,146 @@
+"""Helpers for grid shaped inputs."""
+
+from mmap import mmap
+from typing import Generator, Iterable, Optional, Self
+
+from .coordinates import Coordinate, Direction, direction_deltas
+
+
+def grid_shape(grid: bytes | bytearray | mmap) -> tuple[int, int, int]:
+    """Calculates shape of rectangular grid stored as newline separated rows.
+
+    Cell in `row` and `column` is stored at `row * stride + column` index.
+
+    Args:
+        grid (bytes | bytearray | mmap): Grid buffer.
+
+    Returns:
+        tuple[int, int, int]: Height, width and row stride of grid.
+
+    """
+    width = grid.find(b"\n")
+    if width == -1:
+        width = len(grid)
+
+    stride = width + 1
+    height = (len(grid) + 1) // stride
+
+    return height, width, stride
+
+
+class Grid:
+    """Rectangular grid of byte cells stored in flat buffer of newline separated rows.
+
+    Buffer is used as is, without copying, so grid is read-only for `bytes` and `mmap` buffers
+    and mutable for `bytearray` buffers. Cells are accessed by `Coordinate` and their values are
+    byte values, e.g. `grid[Coordinate(0, 0)] == ord("#")`. Indexing outside of grid raises
+    `IndexError`, instead of reading neighbouring rows or newlines.
+
+    Args:
+        buffer (bytes | bytearray | mmap): Grid rows separated by newlines, optionally
+            ending with newline.
+
+    """
+
+    __slots__ = ("buffer", "height", "width", "stride")
+
+    def __init__(self, buffer: bytes | bytearray | mmap) -> None:
+        self.buffer = buffer
+        self.height, self.width, self.stride = grid_shape(buffer)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[bytes]) -> Self:
+        """Creates mutable grid from rows."""
+
+        return cls(bytearray(b"\n".join(rows)))
+
+    def __getitem__(self, coordinate: Coordinate) -> int:
+        row, column = coordinate
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            raise IndexError(f"{coordinate} is outside of {self}")
+
+        return self.buffer[row * self.stride + column]
+
+    def __setitem__(self, coordinate: Coordinate, value: int) -> None:
+        row, column = coordinate
+        if not (0 <= row < self.height and 0 <= column < self.width):
+            raise IndexError(f"{coordinate} is outside of {self}")
+
+        self.buffer[row * self.stride + column] = value  # type: ignore[index]
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        return 0 <= coordinate[0] < self.height and 0 <= coordinate[1] < self.width
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+    def get(self, coordinate: Coordinate, default: Optional[int] = None) -> Optional[int]:
+        """Returns cell value or default for coordinates outside of grid."""
+
+        row, column = coordinate
+        if 0 <= row < self.height and 0 <= column < self.width:
+            return self.buffer[row * self.stride + column]
+
+        return default
+
+    def index(self, coordinate: Coordinate) -> int:
+        """Returns buffer index of cell."""
+
+        return coordinate[0] * self.stride + coordinate[1]
+
+    def coordinate(self, index: int) -> Coordinate:
+        """Returns coordinate of cell at buffer index."""
+
+        return Coordinate(*divmod(index, self.stride))
+
+    def find(self, value: bytes) -> Optional[Coordinate]:
+        """Returns coordinate of first occurrence of value or `None` if value is not in grid."""
+
+        index = self.buffer.find(value)
+
+        return None if index == -1 else self.coordinate(index)
+
+    def row(self, row: int) -> memoryview:
+        """Returns view of row cells, without copying."""
+
+        start = row * self.stride
+
+        return memoryview(self.buffer)[start : start + self.width]
+
+    def column(self, column: int) -> memoryview:
+        """Returns strided view of column cells, without copying."""
+
+        return memoryview(self.buffer)[column : self.height * self.stride : self.stride]
+
+    def rows(self) -> Generator[memoryview, None, None]:
+        """Yields views of all rows from top to bottom."""
+
+        for row in range(self.height):
+            yield self.row(row)
+
+    def columns(self) -> Generator[memoryview, None, None]:
+        """Yields views of all columns from left to right."""
+
+        for column in range(self.width):
+            yield self.column(column)
+
+    def step(self, coordinate: Coordinate, direction: Direction, steps: int = 1) -> Optional[Coordinate]:
+        """Moves coordinate in direction, returns `None` if grid is left."""
+
+        moved = coordinate + direction.delta * steps
+
+        return moved if moved in self else None
+
+    def neighbours(self, coordinate: Coordinate) -> Generator[tuple[Coordinate, Direction], None, None]:
+        """Yields horizontally and vertically adjacent cells within grid with directions leading to them."""
+
+        for direction, delta in zip(Direction, direction_deltas):
+            neighbour = coordinate + delta
+
+            if neighbour in self:
+                yield neighbour, direction
+
+    def tobytes(self) -> bytes:
+        """Returns copy of grid buffer."""
+
+        return bytes(self.buffer)
@@ -0,0 +1,26 @@
+from aoc._common import Aoc
+from aoc._metrics import count
+
+
+class CountingDay(Aoc):
+    """Sums and finds maximum of whitespace separated numbers, counting parsing and solving calls."""
+
+    parse_calls = 0
+    solved_parts = 0
+
+    def parse(self) -> list[int]:
+        CountingDay.parse_calls += 1
+
+        with self.open_input() as file:
+            return [int(value) for value in file.read().split()]
+
+    def part_1(self) -> int:
+        CountingDay.solved_parts += 1
+        count("numbers", len(self.parsed_input))
+
+        return sum(self.parsed_input)
+
+    def part_2(self) -> int:
+        CountingDay.solved_parts += 1
+
+        return max(self.parsed_input)
@@ -0,0 +1,41 @@
+import aoc.day_16  # noqa: F401
+from aoc._cache import _source_files, AnswerCache
+from tests.unit.counting_day import CountingDay
+
+
+def test_cached_answers_bypass_solver(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 5 3\n")
+    cache = AnswerCache(tmp_path / "cache.sqlite3")
+    CountingDay.solved_parts = 0
+
+    assert CountingDay(input_file, cache).solve() == (9, 5)
+    assert CountingDay(input_file, cache).solve() == (9, 5)
+    assert CountingDay.solved_parts == 2
+
+    input_file.write_text("4\n")
+
+    assert CountingDay(input_file, cache).solve() == (4, 4)
+    assert CountingDay.solved_parts == 4
+
+
+def test_eviction(tmp_path):
+    cache = AnswerCache(tmp_path / "cache.sqlite3", max_entries=2)
+
+    for index in range(3):
+        cache.put(f"key_{index}", index, 0.1)
+
+    assert cache.get("key_0") is None
+    assert cache.get("key_2").answer == 2
+
+    cache.max_age = -1
+
+    assert cache.get("key_2") is None
+
+
+def test_source_files():
+    files = [file.as_posix() for file in _source_files("aoc.day_16")]
+
+    assert files[0].endswith("aoc/day_16.py")
+    assert any(file.endswith("aoc/_common.py") for file in files)
+    assert any(file.endswith("aoc/tools/grid.py") for file in files)
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from pytest import mark, raises
+
+from aoc import _async, days
+from tests.unit.counting_day import CountingDay
+
+
+def test_solve_parses_once(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 5 3\n")
+    CountingDay.parse_calls = 0
+
+    assert CountingDay(input_file).solve() == (9, 5)
+    assert CountingDay.parse_calls == 1
+
+
+def test_solve_many(tmp_path):
+    input_files = []
+    for index in range(5):
+        input_file = tmp_path / f"input_{index}.txt"
+        input_file.write_text(f"{index} 10\n")
+        input_files.append(input_file)
+
+    results = dict(CountingDay.solve_many(input_files, workers=2, chunksize=2))
+
+    assert results == {input_file: (index + 10, 10) for index, input_file in enumerate(input_files)}
+
+
+def test_solve_many_errors(tmp_path):
+    input_files = [tmp_path / "valid.txt", tmp_path / "invalid.txt", tmp_path / "missing.txt"]
+    input_files[0].write_text("1 2\n")
+    input_files[1].write_text("1 x\n")
+
+    results = dict(CountingDay.solve_many(input_files, workers=2, chunksize=3))
+
+    assert results[input_files[0]] == (3, 2)
+    assert isinstance(results[input_files[1]], ValueError)
+    assert isinstance(results[input_files[2]], FileNotFoundError)
+
+
+@mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+def test_map_input_newlines(tmp_path, newline):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"1 2" + newline + newline + b"3" + newline)
+
+    assert CountingDay(input_file).map_input()[:] == b"1 2\n\n3\n"
+    assert CountingDay(input_file.read_bytes()).map_input() == b"1 2\n\n3\n"
+
+
+def test_crlf_grid_day():
+    patterns = b"#.##..##.\n..#.##.#.\n##......#\n##......#\n..#.##.#.\n..##..###\n#.##..##.\n\n"
+    patterns += b"#...##..#\n#....#..#\n..##..###\n#####.##.\n#####.##.\n..##..###\n#....#..#\n"
+
+    assert days[13](patterns.replace(b"\n", b"\r\n")).solve() == days[13](patterns).solve()
+
+
+def test_iter_lines(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2\n\n3\n")
+
+    assert list(CountingDay(input_file).iter_lines()) == ["1 2", "", "3"]
+
+
+class SleepingDay(CountingDay):
+    def part_1(self) -> int:
+        time.sleep(0.5)
+
+        return super().part_1()
+
+
+def test_solve_async(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 5 3\n")
+
+    async def solve() -> list:
+        return await asyncio.gather(*(CountingDay.solve_async(source) for source in (input_file, b"2 4\n")))
+
+    try:
+        assert asyncio.run(solve()) == [(9, 5), (6, 4)]
+
+        with raises(TimeoutError):
+            asyncio.run(SleepingDay.solve_async(b"1\n", timeout=0.1))
+    finally:
+        _async.shutdown()
@@ -1,5 +1,6 @@
-from pytest import mark
+from pytest import mark, raises
 
+from aoc.day_1 import Day1
 from aoc.day_1._tools import decode_cordinate
 
 
@@ -30,3 +31,36 @@ def test_decode_cordinate(encoded_cordinate, decoded_cordinate):
 )
 def test_decode_cordinate_textual(encoded_cordinate, decoded_cordinate):
     assert decode_cordinate(encoded_cordinate, parse_text=True) == decoded_cordinate
+
+
+def test_decode_cordinate_without_digits():
+    with raises(ValueError):
+        decode_cordinate("abc", parse_text=True)
+
+
+@mark.parametrize("workers", (1, 2))
+def test_day_1_chunks(workers, tmp_path):
+    lines = ["two1nine", "eight2wothree", "abcone2threexyz", "xtwone3four", "4nineeightseven2", "zoneight234"]
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(lines))
+
+    for source in (input_file, input_file.read_bytes()):
+        assert Day1(source, workers=workers, chunk_size=10).solve() == (
+            sum(decode_cordinate(line) for line in lines),
+            sum(decode_cordinate(line, parse_text=True) for line in lines),
+        )
+
+
+@mark.parametrize("workers", (1, 2))
+def test_day_1_line_without_digits(workers):
+    solution = Day1(b"a1b\nxyz\n2c\n", workers=workers, chunk_size=4)
+
+    with raises(ValueError, match="xyz"):
+        solution.part_1()
+
+    with raises(ValueError, match="xyz"):
+        solution.part_2()
+
+
+def test_day_1_empty_lines():
+    assert Day1(b"a1b\n\n2c\n").solve() == (33, 33)
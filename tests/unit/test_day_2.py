@@ -1,4 +1,4 @@
-from aoc.day_2 import Cube, parse_game_data
+from aoc.day_2 import Cube, GameIndex, parse_game_data
 
 
 def test_parse_game_data():
@@ -7,3 +7,21 @@ def test_parse_game_data():
         {Cube.RED: 1, Cube.GREEN: 2, Cube.BLUE: 6},
         {Cube.GREEN: 2},
     ]
+
+
+def test_game_index():
+    index = GameIndex.from_lines(
+        [
+            "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green",
+            "Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue",
+            "Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red",
+            "Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red",
+            "Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green",
+        ]
+    )
+    limits = [(12, 13, 14), (4, 3, 6), (20, 13, 15), (0, 0, 0)]
+
+    assert list(index.red) == [4, 1, 20, 14, 6]
+    assert index.possible_games(12, 13, 14) == [1, 2, 5]
+    assert index.id_sums(limits) == [sum(index.possible_games(*limit)) for limit in limits] == [8, 3, 15, 0]
+    assert index.power_sum() == 2286
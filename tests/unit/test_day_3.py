@@ -0,0 +1,48 @@
+from aoc.day_3 import Day3, parse_objects, stream_schematic
+
+schematic_map = b"""467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+
+
+def test_adjacent_numbers():
+    schematic = parse_objects(schematic_map)
+
+    adjacent = [
+        sorted(int(schematic.numbers[number].value) for number in schematic.adjacent_numbers(symbol))
+        for symbol in schematic.symbols
+    ]
+
+    assert adjacent == [[35, 467], [633], [617], [592], [664], [598, 755]]
+
+
+def test_stream_schematic():
+    rows = list(stream_schematic(schematic_map.decode().splitlines()))
+
+    assert rows == [
+        ([467], []),
+        ([], [16345]),
+        ([35, 633], []),
+        ([], []),
+        ([617], []),
+        ([], []),
+        ([592], []),
+        ([755], []),
+        ([], [451490]),
+        ([664, 598], []),
+    ]
+
+
+def test_streaming_solve(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(schematic_map)
+
+    assert Day3(input_file, streaming=True).solve() == Day3(input_file).solve() == (4361, 467835)
@@ -1,6 +1,6 @@
 from pytest import mark
 
-from aoc.day_4 import parse_card
+from aoc.day_4 import match_count, parse_card, score_cards
 
 
 @mark.parametrize(
@@ -16,3 +16,28 @@ from aoc.day_4 import parse_card
 )
 def test_decode_cordinate(card_string, card_id, winning_numbers, guessed_numbers):
     assert parse_card(card_string) == (card_id, winning_numbers, guessed_numbers)
+
+
+@mark.parametrize(
+    "card_string, matches",
+    (
+        ("Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53", 4),
+        ("Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36", 0),
+    ),
+)
+def test_match_count(card_string, matches):
+    assert match_count(card_string) == matches
+
+
+def test_score_cards():
+    assert score_cards([4, 2, 2, 1, 0, 0]) == (13, 30)
+
+
+def test_score_cards_long_matches():
+    match_counts = [3, 20, 1, 0, 40, 2] + [0] * 60
+    copies = [1] * len(match_counts)
+    for card, count in enumerate(match_counts):
+        for won_card in range(card + 1, card + count + 1):
+            copies[won_card] += copies[card]
+
+    assert score_cards(match_counts)[1] == sum(copies)
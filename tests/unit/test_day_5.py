@@ -0,0 +1,37 @@
+from aoc._metrics import Metrics
+from aoc.day_5 import coalesce_intervals, compose_mappings, convert_seed_intervals, find_in_map, Map
+
+
+def test_compose_mappings():
+    mappings = [
+        [Map(range(98, 100), range(50, 52)), Map(range(50, 98), range(52, 100))],
+        [Map(range(15, 52), range(0, 37)), Map(range(52, 54), range(37, 39)), Map(range(0, 15), range(39, 54))],
+    ]
+    composed = compose_mappings(mappings)
+    values = list(range(120))
+
+    expected = [find_in_map(mappings[1], find_in_map(mappings[0], value)) for value in values]
+
+    assert [composed(value) for value in values] == expected
+    assert list(composed.map_many(reversed(values))) == expected[::-1]
+
+
+def test_coalesce_intervals():
+    assert coalesce_intervals([(5, 8), (0, 2), (2, 3), (6, 10), (12, 13)]) == [(0, 3), (5, 10), (12, 13)]
+
+
+def test_convert_seed_intervals():
+    mappings = [
+        [Map(range(98, 100), range(50, 52)), Map(range(50, 98), range(52, 100))],
+        [Map(range(15, 52), range(0, 37)), Map(range(52, 54), range(37, 39)), Map(range(0, 15), range(39, 54))],
+    ]
+    composed = compose_mappings(mappings)
+    metrics = Metrics(profile=[])
+
+    with metrics.span("solve"):
+        intervals = convert_seed_intervals([(79, 93), (55, 68), (90, 110)], mappings)
+
+    assert {value for start, stop in intervals for value in range(start, stop)} == {
+        composed(seed) for seed in [*range(79, 93), *range(55, 68), *range(90, 110)]
+    }
+    assert metrics.counters == {"stage_1_fragments": 3, "stage_2_fragments": len(intervals)}
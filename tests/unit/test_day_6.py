@@ -0,0 +1,23 @@
+from pytest import mark
+
+from aoc.day_6 import count_solutions, count_solutions_many, find_solutions, iter_solutions
+
+
+@mark.parametrize("time, distance", ((7, 9), (15, 40), (30, 200), (3, 2), (4, 4), (0, 0), (1, 0)))
+def test_count_solutions(time, distance):
+    solutions = [hold for hold in range(time) if hold * (time - hold) > distance]
+
+    assert find_solutions(time, distance) == list(iter_solutions(time, distance)) == solutions
+    assert count_solutions(time, distance) == len(solutions)
+
+
+def test_count_solutions_many():
+    assert count_solutions_many([(7, 9), (15, 40), (30, 200), (71530, 940200)]) == [4, 8, 9, 71503]
+
+
+def test_count_solutions_huge_values():
+    time = 10**40 + 7
+    distance = time * time // 5
+    first_hold = (time - count_solutions(time, distance) + 1) // 2
+
+    assert first_hold * (time - first_hold) > distance >= (first_hold - 1) * (time - first_hold + 1)
@@ -0,0 +1,72 @@
+from itertools import combinations_with_replacement
+from typing import cast
+
+from pytest import mark, raises
+
+from aoc.day_7 import (
+    Card,
+    classify_hand,
+    find_hand_type,
+    Hand,
+    HandType,
+    replace_jokers,
+    TypeHand,
+    _parse_cards,
+)
+
+
+@mark.parametrize(
+    ("cards", "jokers", "hand_type"),
+    [
+        ("32T3K", False, HandType.PAIR),
+        ("KTJJT", False, HandType.TWO_PAIR),
+        ("KTJJT", True, HandType.FOUR),
+        ("QQQJA", True, HandType.FOUR),
+        ("JJJJJ", True, HandType.POKER),
+        ("23456", False, HandType.HIGH_CARD),
+    ],
+)
+def test_hand_type(cards: str, jokers: bool, hand_type: HandType) -> None:
+    assert Hand(_parse_cards(cards, jokers)).hand_type == hand_type
+
+
+@mark.parametrize(
+    ("lower", "higher", "jokers"),
+    [
+        ("2AAAA", "33332", False),
+        ("KTJJT", "KK677", False),
+        ("T55J5", "QQQJA", False),
+        ("JKKK2", "QQQQ2", True),
+        ("KK677", "JJJJ2", True),
+        ("AAAAK", "JJJJJ", False),
+    ],
+)
+def test_hand_order(lower: str, higher: str, jokers: bool) -> None:
+    lower_hand, higher_hand = Hand(_parse_cards(lower, jokers)), Hand(_parse_cards(higher, jokers))
+
+    assert lower_hand < higher_hand
+    assert lower_hand.key < higher_hand.key
+
+
+def test_hand_key() -> None:
+    hand = Hand((Card.ACE, Card.TWO, Card.JOKER, Card.TEN, Card.KING))
+
+    assert hand.key == HandType.PAIR.value << 20 | 0xE21AD
+
+
+@mark.parametrize("jokers", [False, True])
+def test_classify_hand(jokers: bool) -> None:
+    # Type depends only on multiset of cards, so all multisets cover all hands.
+    cards = [card for card in Card if card is not (Card.JACK if jokers else Card.JOKER)]
+
+    for hand in combinations_with_replacement(cards, 5):
+        hand = cast(TypeHand, hand)
+        expected = find_hand_type(replace_jokers(hand) if Card.JOKER in hand else hand)
+
+        assert classify_hand(hand) == expected, hand
+
+
+@mark.parametrize(("cards", "jokers"), [("AKQT", False), ("AKQJ", True), ("AAKKQQ", False), ("", True)])
+def test_classify_hand_invalid(cards: str, jokers: bool) -> None:
+    with raises(ValueError):
+        classify_hand(_parse_cards(cards, jokers))
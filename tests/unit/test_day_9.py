@@ -0,0 +1,16 @@
+from pytest import mark
+
+from aoc.day_9 import extrapolate
+
+
+@mark.parametrize(
+    ("history", "expected"),
+    [
+        ([0, 3, 6, 9, 12, 15], (18, -3)),
+        ([1, 3, 6, 10, 15, 21], (28, 0)),
+        ([10, 13, 16, 21, 30, 45], (68, 5)),
+        ([7, 7, 7], (7, 7)),
+    ],
+)
+def test_extrapolate(history: list[int], expected: tuple[int, int]) -> None:
+    assert extrapolate(history) == expected
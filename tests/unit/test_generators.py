@@ -0,0 +1,19 @@
+from pytest import mark
+
+from aoc import days
+from benchmarks.generators import generate, generators
+
+
+@mark.parametrize("day", sorted(generators))
+def test_generated_input_is_solvable(day, tmp_path):
+    input_file = tmp_path / f"day_{day}.txt"
+    input_file.write_text(generate(day, 1 if day in {6, 20} else 10))
+
+    part_1, part_2 = days[day](input_file).solve()
+
+    assert isinstance(part_1, int) and isinstance(part_2, int)
+
+
+def test_generate_is_deterministic():
+    assert generate(17, 20, seed=1) == generate(17, 20, seed=1)
+    assert generate(17, 20, seed=1) != generate(17, 20, seed=2)
@@ -0,0 +1,67 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+from aoc._metrics import count, Metrics
+from tests.unit.counting_day import CountingDay
+
+
+def test_spans_and_counters(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 5 3\n")
+    metrics = Metrics({"day": 0}, profile=[])
+
+    assert CountingDay(input_file, metrics=metrics).solve() == (9, 5)
+    assert set(metrics.spans) == {"parse", "part_1", "part_2"}
+    assert metrics.counters == {"numbers": 3}
+
+    count("numbers")  # Outside of spans counts are dropped.
+    assert metrics.counters == {"numbers": 3}
+
+
+class SlowParsingDay(CountingDay):
+    def parse(self) -> list[int]:
+        time.sleep(0.2)
+
+        return super().parse()
+
+
+def test_parse_excluded_from_parts(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 5 3\n")
+    metrics = Metrics({"day": 0}, profile=[])
+
+    assert SlowParsingDay(input_file, metrics=metrics).solve() == (9, 5)
+    assert metrics.spans["parse"] >= 0.2
+    assert metrics.spans["part_1"] < 0.1
+
+
+def test_export(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1\n")
+    metrics = Metrics({"day": 0}, profile=["cprofile", "tracemalloc"], top=1)
+    CountingDay(input_file, metrics=metrics).part_1()
+
+    file = io.StringIO()
+    metrics.export(file)
+    records = [json.loads(line) for line in file.getvalue().splitlines()]
+
+    assert {record["type"] for record in records} == {"span", "counter", "cprofile", "tracemalloc"}
+    assert all(record["day"] == 0 for record in records)
+
+
+def test_profilers_imported_only_when_enabled():
+    code = "\n".join(
+        [
+            "import sys",
+            "from aoc._metrics import Metrics",
+            "with Metrics(profile=[]).span('part_1'): pass",
+            "assert 'cProfile' not in sys.modules and 'tracemalloc' not in sys.modules",
+        ]
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+from aoc import days
+from aoc._common import Aoc
+
+
+def test_days():
+    assert list(days) == list(range(1, 21))
+    assert 21 not in days
+    assert all(issubclass(days[day], Aoc) and days[day].__name__ == f"Day{day}" for day in days)
+
+
+def test_days_are_imported_lazily():
+    script = (
+        "import sys, aoc\n"
+        "loaded = lambda: sorted(name for name in sys.modules if name.startswith('aoc.day_'))\n"
+        "print(loaded(), list(aoc.days)[-1], loaded())\n"
+        "aoc.days[1]\n"
+        "print(loaded())\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True, env=env).stdout
+
+    assert output.splitlines() == ["[] 20 []", "['aoc.day_1', 'aoc.day_1._tools']"]
@@ -0,0 +1,38 @@
+from aoc._runner import collect_inputs, run_day, run_days
+
+
+def test_collect_inputs(tmp_path):
+    for name in ("day_1.txt", "day5_alice.txt", "day_5_bob.txt", "notes.txt"):
+        (tmp_path / name).write_text("")
+
+    assert collect_inputs([tmp_path], [5]) == [
+        (5, str(tmp_path / "day5_alice.txt")),
+        (5, str(tmp_path / "day_5_bob.txt")),
+        (5, str(tmp_path / "notes.txt")),
+    ]
+    assert collect_inputs([tmp_path], []) == [
+        (5, str(tmp_path / "day5_alice.txt")),
+        (1, str(tmp_path / "day_1.txt")),
+        (5, str(tmp_path / "day_5_bob.txt")),
+    ]
+
+
+def test_run_day(tmp_path):
+    input_file = tmp_path / "day_6.txt"
+    input_file.write_text("Time:      7  15   30\nDistance:  9  40  200\n")
+
+    result = run_day(6, str(input_file))
+
+    assert result.answers == (288, 71503)
+    assert result.error is None
+
+
+def test_run_days_fresh_workers(tmp_path):
+    input_file = tmp_path / "day_6.txt"
+    input_file.write_text("Time:      7  15   30\nDistance:  9  40  200\n")
+
+    results = run_days([(6, str(input_file)), (6, str(input_file))], workers=1)
+    pooled_results = run_days([(6, str(input_file))], workers=2)
+
+    assert [result.answers for result in results + pooled_results] == [(288, 71503)] * 3
+    assert all(result.peak_rss is None or result.peak_rss > 0 for result in results + pooled_results)
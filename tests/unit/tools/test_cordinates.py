@@ -1,4 +1,6 @@
-from aoc.tools.coordinates import Coordinate, get_adjacent_cordinates
+from pytest import raises
+
+from aoc.tools.coordinates import Coordinate, get_adjacent_cordinates, iter_adjacent_cordinates
 
 
 def test_get_adjacent_cordinates():
@@ -29,3 +31,29 @@ def test_get_adjacent_cordinates_not_diagonal():
         Coordinate(2, 3),
         Coordinate(3, 2),
     }
+
+
+def test_iter_adjacent_cordinates():
+    cordinates = [Coordinate(2, 2), Coordinate(5, 0)]
+
+    adjacent = list(iter_adjacent_cordinates(cordinates, diagonal=False))
+
+    assert adjacent == [
+        (Coordinate(2, 2), Coordinate(1, 2)),
+        (Coordinate(2, 2), Coordinate(3, 2)),
+        (Coordinate(2, 2), Coordinate(2, 1)),
+        (Coordinate(2, 2), Coordinate(2, 3)),
+        (Coordinate(5, 0), Coordinate(4, 0)),
+        (Coordinate(5, 0), Coordinate(6, 0)),
+        (Coordinate(5, 0), Coordinate(5, -1)),
+        (Coordinate(5, 0), Coordinate(5, 1)),
+    ]
+
+
+def test_multiplication():
+    cordinate = Coordinate(1, -2)
+
+    assert cordinate * 3 == 3 * cordinate == Coordinate(3, -6)
+
+    with raises(TypeError):
+        cordinate * cordinate
@@ -21,3 +21,13 @@ def test_opposite(direction, opposite):
 ))
 def test_rotate(direction, rotated):
     assert direction.rotate() == rotated
+
+
+@mark.parametrize("direction,rotated", (
+        (Direction.UP, Direction.LEFT),
+        (Direction.DOWN, Direction.RIGHT),
+        (Direction.LEFT, Direction.DOWN),
+        (Direction.RIGHT, Direction.UP)
+))
+def test_rotate_counterclockwise(direction, rotated):
+    assert direction.rotate(False) == rotated
@@ -0,0 +1,51 @@
+from pytest import mark, raises
+
+from aoc.tools.coordinates import Coordinate, Direction
+from aoc.tools.grid import Grid, grid_shape
+
+
+@mark.parametrize(
+    "grid, shape",
+    (
+        (b"abc\ndef\n", (2, 3, 4)),
+        (b"abc\ndef", (2, 3, 4)),
+        (b"abc", (1, 3, 4)),
+    ),
+)
+def test_grid_shape(grid, shape):
+    assert grid_shape(grid) == shape
+
+
+def test_grid():
+    grid = Grid(bytearray(b"abc\ndef\n"))
+
+    assert (grid.height, grid.width) == (2, 3)
+    assert grid[Coordinate(1, 2)] == ord("f")
+    assert Coordinate(1, 3) not in grid and grid.get(Coordinate(-1, 0)) is None
+    assert grid.find(b"e") == Coordinate(1, 1)
+    assert [row.tobytes() for row in grid.rows()] == [b"abc", b"def"]
+    assert [column.tobytes() for column in grid.columns()] == [b"ad", b"be", b"cf"]
+    assert grid.step(Coordinate(0, 0), Direction.RIGHT, 2) == Coordinate(0, 2)
+    assert grid.step(Coordinate(0, 0), Direction.UP) is None
+    assert set(grid.neighbours(Coordinate(0, 0))) == {
+        (Coordinate(0, 1), Direction.RIGHT),
+        (Coordinate(1, 0), Direction.DOWN),
+    }
+
+    grid.column(1)[:] = b"xy"
+    grid[Coordinate(0, 0)] = ord("z")
+
+    assert grid.tobytes() == b"zxc\ndyf\n"
+
+
+@mark.parametrize("coordinate", [Coordinate(0, -1), Coordinate(0, 2), Coordinate(-1, 0), Coordinate(2, 0)])
+def test_grid_bounds(coordinate):
+    grid = Grid(bytearray(b"ab\ncd\n"))
+
+    assert grid.get(coordinate) is None
+
+    with raises(IndexError):
+        grid[coordinate]
+
+    with raises(IndexError):
+        grid[coordinate] = ord("x")